@@ -9,10 +9,39 @@ if __name__ == "__main__":
         debug()
     elif "--units" in argv:
         units()
+    elif "--perft" in argv:
+        from chess.perft import run
+        run(argv[argv.index("--perft") + 1:])
+    elif "--divide" in argv:
+        from chess.perft import run_divide
+        run_divide(argv[argv.index("--divide") + 1:])
+    elif "--archive" in argv:
+        from chess.game.archive import run
+        run(argv[argv.index("--archive") + 1:])
+    elif "--book" in argv:
+        from chess.game.book import run
+        run(argv[argv.index("--book") + 1:])
+    elif "--search" in argv:
+        from chess.players.bot import run
+        run(argv[argv.index("--search") + 1:])
+    elif "--pgn" in argv:
+        from chess.game.pgn import run
+        run(argv[argv.index("--pgn") + 1:])
     else:
         from chess.players.physical import PhysicalPlayer
         from chess.game.game import ChessGame
         whites = input("Nom des blancs: ")
-        blacks = input("Nom des noirs: ")
-        ChessGame((PhysicalPlayer(1, whites),
-                  PhysicalPlayer(-1, blacks))).start().autoplay()
+        if "--bot" in argv:
+            from chess.players.bot import BotPlayer
+            depth = argv[argv.index("--bot") + 1:][:1]
+            black_player = BotPlayer(-1, "Bot", int(depth[0]) if depth and depth[0].isdigit() else 3)
+        else:
+            black_player = PhysicalPlayer(-1, input("Nom des noirs: "))
+        game = ChessGame((PhysicalPlayer(1, whites), black_player))
+
+        if "--record" in argv:
+            from chess.game.pgn import PGNWriter
+            with open(argv[argv.index("--record") + 1], "a", encoding="utf-8") as output:
+                game.record_to(PGNWriter(output)).start().autoplay()
+        else:
+            game.start().autoplay()
@@ -0,0 +1,71 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from chess.boards.board import Board
+    from chess.pieces._piece import Piece
+
+
+class BitBoards:
+    """Mirror of the board's playable pieces as integer masks.
+
+    One mask is kept per (player direction, piece type), plus the occupancy
+    mask of each player. The Board keeps it in sync with its pieces.
+    """
+
+    def __init__(self, board: 'Board') -> None:
+        self.board = board
+        self.geometry = board.geometry
+
+        self.pieces: dict[tuple[int, type['Piece']], int] = {}
+        self.occupied: dict[int, int] = {1: 0, -1: 0}
+
+    @property
+    def all(self):
+        return self.occupied[1] | self.occupied[-1]
+
+    @property
+    def empty(self):
+        return self.geometry.full & ~self.all
+
+    def of(self, direction: int):
+        return self.occupied[direction]
+
+    def bit(self, piece: 'Piece'):
+        return 1 << piece.position.square
+
+    def place(self, piece: 'Piece', square: int):
+        key = (piece.player.direction, type(piece))
+        bit = 1 << square
+        self.pieces[key] = self.pieces.get(key, 0) | bit
+        self.occupied[piece.player.direction] |= bit
+
+    def remove(self, piece: 'Piece', square: int):
+        key = (piece.player.direction, type(piece))
+        bit = 1 << square
+        self.pieces[key] = self.pieces.get(key, 0) & ~bit
+        self.occupied[piece.player.direction] &= ~bit
+
+    def attacks(self, direction: int):
+        """Get the mask of every square attacked by the player of the given direction
+        """
+        empty = self.empty
+        attacks = 0
+
+        for (side, kind), mask in self.pieces.items():
+            if side != direction or not mask:
+                continue
+
+            kind_attacks = kind.attacks_mask(
+                self.geometry, mask, empty, direction
+            )
+            if kind_attacks is None:
+                # The piece does not describe its pattern, ask each one of them
+                for square in self.geometry.squares(mask):
+                    piece = self.board._occupancy_at(square)
+                    assert piece is not None, "Bitboards are out of sync."
+                    for position in piece.contesting_positions():
+                        attacks |= 1 << self.geometry.square_of(position)
+            else:
+                attacks |= kind_attacks
+
+        return attacks
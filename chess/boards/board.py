@@ -1,8 +1,18 @@
-from typing import Iterable, Literal
+from typing import TYPE_CHECKING, Iterable, Literal
+from chess.boards.bitboard import BitBoards
+from chess.boards.cache import LRUCache
+from chess.boards.geometry import Geometry
+from chess.boards.material import Material
+from chess.boards.zobrist import ZobristKeys
 from chess.movement.board_movement import BoardMovement
-from chess.players._player import Player
+from chess.movement.generator import LegalMoveGenerator
+from chess.pieces._piece import WithMovementObserver
+from chess.players._player import Player, StatusVerifier
 from chess.position import Position
 
+if TYPE_CHECKING:
+    from chess.pieces._piece import Piece
+
 
 class Board:
     EMPTY_EVEN_CASE_CHAR = "▣"
@@ -15,11 +25,50 @@ class Board:
     X_RANGE: list[str] = []
     Y_RANGE: list[int] = []
 
+    # Number of positions kept by `status_of` and `legal_moves`
+    STATUS_CACHE_SIZE = 256
+    LEGAL_MOVES_CACHE_SIZE = 1024
+
     def __init__(self) -> None:
         from chess.pieces._piece import Piece
 
         # Autofilled by Piece class
         self._pieces: list[Piece] = []
+        self.geometry = Geometry.of(tuple(self.X_RANGE), tuple(self.Y_RANGE))
+
+        # Playable pieces indexed by their square, kept up to date by the Piece class
+        self._occupancy: list[Piece | None] = [None] * self.geometry.size
+        self.bitboards = BitBoards(self)
+        self.material = Material(self.geometry)
+
+        # Zobrist key of the pieces, kept up to date with the square index
+        self.zobrist = ZobristKeys.of(self.geometry)
+        self.__pieces_key = 0
+        self.__turn = Player.WHITES_DIRECTION
+
+        # Values derived from the pieces, dropped when a piece moves
+        self.__castling_rights: int | None = None
+        self.__unmoved_pawns_key: int | None = None
+        self.__attack_maps: dict[int, int] = {}
+        self.__legal_moves: dict[int, LegalMoveGenerator | None] = {}
+
+        # Values shared by the identical positions, keyed by (position key, player direction)
+        self.statuses: LRUCache[StatusVerifier] = LRUCache(
+            self.STATUS_CACHE_SIZE
+        )
+        self.legal_moves_cache: LRUCache[LegalMoveGenerator | None] = LRUCache(
+            self.LEGAL_MOVES_CACHE_SIZE
+        )
+
+        # Draw rules state, kept up to date by the (top level) board movements
+        self.halfmove_clock = 0
+        self.__repetitions: dict[int, int] = {}
+        self.__reached: list[tuple[int, int, Position | None]] = []
+
+        # The case a pawn just skipped by moving two cases (en passant captures are not played)
+        self.en_passant: Position | None = None
+        # Number of the move the recorded movements start from (see `fullmove_number`)
+        self.first_fullmove = 1
 
         self.__show_board_coordonates = False
         self.__reverse_board_y = False
@@ -27,11 +76,8 @@ class Board:
 
     def auto_setup_kings(self, whites: tuple[Player, str | Position], blacks: tuple[Player, str | Position]):
         from chess.pieces.king import King
-        self._pieces = [
-            piece
-            for piece in self._pieces
-            if not isinstance(piece, King)
-        ]
+        for piece in self.all_pieces.type(King).get():
+            piece.remove_from_board()
 
         for (player, position) in (whites, blacks):
             King(self, player, str(position))
@@ -49,20 +95,369 @@ class Board:
         """Get all the pieces (even the not playable ones) of the board
         """
         from chess.pieces._piece import PieceList
-        return PieceList(self._pieces)
+        return PieceList(self._pieces, self)
+
+    def _occupy(self, piece: 'Piece'):
+        """Registers the (playable) piece on its current square
+        """
+        square = piece.position.square
+        replaced = self._occupancy[square]
+        if replaced is not None:
+            self.bitboards.remove(replaced, square)
+            self.material.remove(replaced, square)
+            self.__pieces_key ^= self.zobrist.piece(replaced, square)
+            self.__unmoved_piece_changed(replaced)
+
+        self._occupancy[square] = piece
+        self.bitboards.place(piece, square)
+        self.material.add(piece, square)
+        self.__pieces_key ^= self.zobrist.piece(piece, square)
+        self.__unmoved_piece_changed(piece)
+        self.__pieces_changed()
+
+    def _release(self, piece: 'Piece'):
+        """Unregisters the piece from its current square, if it was the one occupying it
+        """
+        square = piece.position.square
+        if self._occupancy[square] is piece:
+            self._occupancy[square] = None
+            self.bitboards.remove(piece, square)
+            self.material.remove(piece, square)
+            self.__pieces_key ^= self.zobrist.piece(piece, square)
+            self.__unmoved_piece_changed(piece)
+            self.__pieces_changed()
+
+    def __unmoved_piece_changed(self, piece: 'Piece'):
+        # The pieces that have moved are not part of the unmoved pawns key: they cannot change it
+        if isinstance(piece, WithMovementObserver) and not piece.has_moved:
+            self.__unmoved_pawns_key = None
+
+    def __pieces_changed(self):
+        self.__castling_rights = None
+        if self.__attack_maps:
+            self.__attack_maps = {}
+        if self.__legal_moves:
+            self.__legal_moves = {}
+
+    def _pieces_removed(self):
+        """Should be called when pieces are removed from the board, as the cached statuses may refer to them
+        """
+        self.statuses.clear()
+
+    def _first_moves_changed(self):
+        """Should be called when a piece moves for the first time (or this first movement is canceled)
+        """
+        self.__castling_rights = None
+        self.__unmoved_pawns_key = None
+        if self.__legal_moves:
+            self.__legal_moves = {}
+
+    def _movement_started(self):
+        """Should be called before a top level movement is made
+        """
+        # The position the recorded movements start from
+        if not self.__reached:
+            self.__repetitions = {self.key: 1}
+
+    def _movement_made(self, resets_clock: bool, en_passant: Position | None = None):
+        """Should be called once a top level movement has been made
+
+        Args:
+            resets_clock (bool): True if the movement was a capture or a pawn move
+            en_passant (Position | None, optional): The case skipped by a pawn moving two cases. Defaults to None.
+        """
+        key = self.key
+        self.__reached.append((key, self.halfmove_clock, self.en_passant))
+        self.__repetitions[key] = self.__repetitions.get(key, 0) + 1
+        self.halfmove_clock = 0 if resets_clock else self.halfmove_clock + 1
+        self.en_passant = en_passant
+
+    def _movement_canceled(self):
+        """Should be called before a top level movement is canceled
+        """
+        key, self.halfmove_clock, self.en_passant = self.__reached.pop()
+        self.__repetitions[key] -= 1
+
+    @property
+    def fullmove_number(self):
+        """Number of the current move, starting at `first_fullmove` and incremented after each blacks' movement
+        """
+        played = len(self.__reached)
+        # The player who had to play before the recorded movements
+        first_turn = self.turn if played % 2 == 0 else -self.turn
+        return self.first_fullmove + (
+            played + (first_turn == Player.BLACKS_DIRECTION)
+        ) // 2
+
+    @property
+    def repetitions(self):
+        """Number of times the current position has been reached
+        """
+        if not self.__reached:
+            return 1
+        return self.__repetitions.get(self.key, 0)
+
+    def _occupancy_at(self, square: int):
+        return self._occupancy[square]
+
+    def position_of(self, square: int):
+        return self.geometry.positions[square]
+
+    def positions_of(self, mask: int):
+        """Get the positions of every square in the mask
+        """
+        positions = self.geometry.positions
+        return [positions[square] for square in self.geometry.squares(mask)]
 
     def empty(self):
         self._pieces = []
+        self._occupancy = [None] * self.geometry.size
+        self.bitboards = BitBoards(self)
+        self.material = Material(self.geometry)
+        self.__pieces_key = 0
+        self.__unmoved_pawns_key = None
+        self.__pieces_changed()
+        self.statuses.clear()
+        self.legal_moves_cache.clear()
+        self.halfmove_clock = 0
+        self.__repetitions = {}
+        self.__reached = []
+        self.en_passant = None
+        self.first_fullmove = 1
+        self.__turn = Player.WHITES_DIRECTION
 
     def setup(self, whites: Player, blacks: Player):
         pass
 
+    def piece_types(self) -> 'list[type[Piece]]':
+        """Get the types of pieces this board is played with (one per notation)
+        """
+        from chess.pieces.bishop import Bishop
+        from chess.pieces.king import King
+        from chess.pieces.knight import Knight
+        from chess.pieces.pawn import Pawn
+        from chess.pieces.queen import Queen
+        from chess.pieces.rook import Rook
+        return [Pawn, Knight, Bishop, Rook, Queen, King]
+
+    @classmethod
+    def from_fen(cls, fen: str, whites: Player | None = None, blacks: Player | None = None) -> 'Board':
+        """Creates a board in the position of the FEN notation (see `load_fen`).
+        The board has the normal size if its class has no size.
+        """
+        if not (cls.X_RANGE and cls.Y_RANGE):
+            from chess.boards.normal import NormalEmptyBoard
+            return NormalEmptyBoard().load_fen(fen, whites, blacks)
+        return cls().load_fen(fen, whites, blacks)
+
+    def load_fen(self, fen: str, whites: Player | None = None, blacks: Player | None = None):
+        """Replaces the board pieces by the position of the FEN notation
+        (pieces, player to play, castling rights, en passant case and movements counters)
+
+        Args:
+            fen (str): The FEN notation
+            whites (Player | None, optional): The whites player. Defaults to a new player.
+            blacks (Player | None, optional): The blacks player. Defaults to a new player.
+        """
+        from chess.boards.fen import load_fen
+        load_fen(
+            self, fen,
+            whites or Player(Player.WHITES_DIRECTION),  # type: ignore
+            blacks or Player(Player.BLACKS_DIRECTION),  # type: ignore
+        )
+        return self
+
+    def to_fen(self):
+        """Get the FEN notation of the current position
+        """
+        from chess.boards.fen import board_fen
+        return board_fen(self)
+
     def get_king_of(self, player: Player, get_opponent_king=False):
+        king = self._king_of(
+            player.direction * (-1 if get_opponent_king else 1)
+        )
+        if king is None:
+            raise LookupError("The player has no king.")
+        return king
+
+    def _king_of(self, direction: int):
         from chess.pieces.king import King
-        for piece in self.pieces.of(player, not get_opponent_king):
-            if isinstance(piece, King):
-                return piece
-        raise LookupError("The player has no king.")
+        for (side, kind), mask in self.bitboards.pieces.items():
+            if side == direction and mask and issubclass(kind, King):
+                king: King | None = self._occupancy_at(
+                    next(self.geometry.squares(mask))
+                )  # type: ignore
+                assert king is not None, "Bitboards are out of sync."
+                return king
+        return None
+
+    @property
+    def turn(self):
+        """The direction of the player who has to play
+        """
+        return self.__turn
+
+    @turn.setter
+    def turn(self, direction: int):
+        self.__turn = direction
+
+    def _pass_turn(self):
+        self.__turn = -self.__turn
+
+    def castling_rights(self):
+        """Get the castling rights of both players, as a mask.
+
+        Bits are ordered as: whites king side, whites queen side, blacks king side, blacks queen side.
+        The rights only depend on the king and rooks that have not moved, not on the path being free.
+        """
+        if self.__castling_rights is not None:
+            return self.__castling_rights
+
+        from chess.pieces.king import CastlingDirection
+
+        rights = 0
+        for (bit, direction) in ((0, Player.WHITES_DIRECTION), (2, Player.BLACKS_DIRECTION)):
+            king = self._king_of(direction)
+            if king is None:
+                continue
+            if king.castling_rook(CastlingDirection.KING):
+                rights |= 1 << bit
+            if king.castling_rook(CastlingDirection.QUEEN):
+                rights |= 1 << (bit + 1)
+
+        self.__castling_rights = rights
+        return rights
+
+    def attackers(self, square: int, by_direction: int, occupied: int | None = None):
+        """Get the mask of the pieces of the player of the given direction attacking the square.
+        The search looks outward from the square for each type of piece of the player.
+
+        Args:
+            square (int): The attacked square
+            by_direction (int): The direction of the attacking player
+            occupied (int | None, optional): The occupied squares stopping the rays. Defaults to the board's pieces.
+        """
+        if occupied is None:
+            occupied = self.bitboards.all
+
+        attackers = 0
+        for (side, kind), mask in self.bitboards.pieces.items():
+            if side != by_direction or not mask:
+                continue
+
+            kind_attackers = kind.attackers_mask(
+                self.geometry, square, occupied, side
+            )
+            if kind_attackers is None:
+                # The piece does not describe its pattern, ask each one of them
+                target = self.geometry.positions[square]
+                for attacker_square in self.geometry.squares(mask):
+                    piece = self._occupancy[attacker_square]
+                    assert piece is not None, "Bitboards are out of sync."
+                    if target in piece.contesting_positions():
+                        attackers |= 1 << attacker_square
+            else:
+                attackers |= kind_attackers & mask
+
+        return attackers
+
+    def is_attacked(self, square: int, by_direction: int):
+        """Tests if the square is attacked by the player of the given direction (see `attackers`)
+        """
+        return bool(self.attackers(square, by_direction))
+
+    def legal_moves(self, direction: int):
+        """Get the legal movements generator of the player of the given direction, for the current position.
+        Generators are shared by the identical positions (see `legal_moves_cache`).
+
+        Returns:
+            LegalMoveGenerator | None: The generator, or None if the legal movements can only be found by making them.
+        """
+        if direction in self.__legal_moves:
+            return self.__legal_moves[direction]
+
+        generator = self.__legal_moves[direction] = self.legal_moves_cache.lookup(
+            (self.key, direction),
+            lambda: (
+                LegalMoveGenerator(self, direction)
+                if LegalMoveGenerator.supports(self, direction)
+                else None
+            )
+        )
+        return generator
+
+    def iter_legal_movements(self, direction: int):
+        """Iterates over the legal movements of the player of the given direction.
+        Kings come last, as their movements are the most expensive to verify.
+        """
+        from chess.pieces.king import King
+
+        kinds = sorted(
+            (
+                kind for (side, kind), mask in self.bitboards.pieces.items()
+                if side == direction and mask
+            ),
+            key=lambda kind: issubclass(kind, King)
+        )
+        for kind in kinds:
+            for square in self.geometry.squares(self.bitboards.pieces[(direction, kind)]):
+                piece = self._occupancy[square]
+                assert piece is not None, "Bitboards are out of sync."
+                yield from piece.iter_legal_movements()
+
+    def status_of(self, player: Player):
+        """Get the status of the player in the current position.
+        Statuses are shared by the identical positions, so that their check (and checkmate) are only computed once.
+        Draw reasons depend on the previous movements: they are computed again by each `with_draw` call.
+        """
+        return self.statuses.lookup(
+            (self.key, player.direction),
+            lambda: player.verify_status(self)
+        )
+
+    def attack_map(self, direction: int):
+        """Get the mask of all the squares attacked by the player of the given direction.
+        The map is cached until a piece moves.
+        """
+        attacks = self.__attack_maps.get(direction)
+        if attacks is None:
+            attacks = self.__attack_maps[direction] = self.bitboards.attacks(
+                direction
+            )
+        return attacks
+
+    def unmoved_pawns_key(self):
+        """Get the Zobrist key of the pawns that have not moved yet.
+        Their squares do not tell it: a pawn can be set up out of its first line, or marked as moved.
+        """
+        if self.__unmoved_pawns_key is not None:
+            return self.__unmoved_pawns_key
+
+        from chess.pieces.pawn import Pawn
+
+        key = 0
+        keys = self.zobrist.unmoved_pawns
+        for direction in (Player.WHITES_DIRECTION, Player.BLACKS_DIRECTION):
+            for square in self.geometry.squares(self.bitboards.pieces.get((direction, Pawn), 0)):
+                pawn = self._occupancy[square]
+                if pawn is not None and not pawn.has_moved:  # type: ignore
+                    key ^= keys[square]
+
+        self.__unmoved_pawns_key = key
+        return key
+
+    @property
+    def key(self) -> int:
+        """The Zobrist key of the position, including the player to play, the castling rights
+        and the pawns that can still move by two squares (every state the legal movements depend on)
+        """
+        return (
+            self.__pieces_key
+            ^ self.zobrist.castling[self.castling_rights()]
+            ^ self.unmoved_pawns_key()
+            ^ (self.zobrist.side if self.__turn == Player.BLACKS_DIRECTION else 0)
+        )
 
     def with_coordonates(self, show=True):
         self.__show_board_coordonates = show
@@ -75,17 +470,8 @@ class Board:
     def __eq__(self, value):
         return hash(self) == value
 
-    def state_identifier(self):
-        representations = [
-            f"{int(piece.player.is_white)}{piece.NOTATION}{piece.position}"
-            for piece in self.pieces.get()
-        ]
-
-        representations.sort()
-        return "".join(representations)
-
     def __hash__(self) -> int:
-        return hash(self.state_identifier())
+        return self.key
 
     def __str__(self) -> str:
         board = []
@@ -93,7 +479,7 @@ class Board:
         for (y_index, y_axis) in enumerate(self.Y_RANGE):
             line = []
             for (x_index, x_axis) in enumerate(self.X_RANGE):
-                piece = self.pieces.at(x_axis, y_axis).first()
+                piece = self._occupancy[self.geometry.square(x_index, y_index)]
                 if piece:
                     line.append(str(piece))
                 else:
@@ -125,12 +511,25 @@ class MovementStack:
     def __init__(self, init_from: Iterable = []) -> None:
         self.__stack: list[BoardMovement] = list(init_from)
 
+        # Notations of the movements, oldest first, rendered once (see `__str__`)
+        self.__rendered: list[str] = [str(m) for m in self.__stack]
+        self.__string: str | None = None
+
     def insert(self, movement: BoardMovement):
+        self.__rendered.append(str(movement))
+        self.__string = None
         return self.__stack.append(movement)
 
     def pop(self):
+        self.__rendered.pop()
+        self.__string = None
         return self.__stack.pop()
 
+    def top(self):
+        """Get the last movement of the stack, or None if it is empty
+        """
+        return self.__stack[-1] if self.__stack else None
+
     def size(self):
         return len(self.__stack)
 
@@ -150,19 +549,19 @@ class MovementStack:
         return iter(iter_to)
 
     def __str__(self) -> str:
-        return " - ".join([
-            str(m)
-            for m in self.iter('lifo')
-        ])
+        # Joined only when displayed, newest first
+        if self.__string is None:
+            self.__string = " - ".join(reversed(self.__rendered))
+        return self.__string
 
 
 class LastMovementManager(BoardMovement):
     def __init__(self, manager: MovementStack) -> None:
-        moves = list(manager.iter("lifo"))
-        assert moves, "No movements in the stack."
+        movement = manager.top()
+        assert movement is not None, "No movements in the stack."
 
         self.__manager = manager
-        self.__movement = moves[0]
+        self.__movement = movement
         self.__dict__.update(self.__movement.__dict__)
 
     def unvalidate(self):
@@ -0,0 +1,55 @@
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, TypeVar
+
+Value = TypeVar('Value')
+
+
+class LRUCache(Generic[Value]):
+    """Mapping of a bounded size, dropping the least recently used values first.
+
+    The hits and misses of `lookup` are counted, to measure the cache efficiency.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        assert capacity > 0, "The capacity of a cache must be positive."
+
+        self.__values: OrderedDict[Hashable, Value] = OrderedDict()
+        self.__capacity = capacity
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def capacity(self):
+        return self.__capacity
+
+    @capacity.setter
+    def capacity(self, capacity: int):
+        assert capacity > 0, "The capacity of a cache must be positive."
+        self.__capacity = capacity
+        while len(self.__values) > capacity:
+            self.__values.popitem(last=False)
+
+    def lookup(self, key: Hashable, compute: Callable[[], Value]) -> Value:
+        """Get the value of the key, computing (and storing) it if it is not cached
+        """
+        values = self.__values
+        if key in values:
+            self.hits += 1
+            values.move_to_end(key)
+            return values[key]
+
+        self.misses += 1
+        value = values[key] = compute()
+        if len(values) > self.__capacity:
+            values.popitem(last=False)
+        return value
+
+    def clear(self):
+        self.__values.clear()
+
+    def __len__(self):
+        return len(self.__values)
+
+    def __str__(self) -> str:
+        lookups = self.hits + self.misses
+        return f"{len(self)}/{self.capacity} ({self.hits}/{lookups} hits)"
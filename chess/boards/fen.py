@@ -0,0 +1,154 @@
+"""Forsyth-Edwards Notation (FEN) of the board positions"""
+
+from typing import TYPE_CHECKING
+from chess.players._player import Player
+
+if TYPE_CHECKING:
+    from chess.boards.board import Board
+
+START_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+
+# Letters of the castling rights, ordered as the bits of `Board.castling_rights`
+CASTLING_LETTERS = "KQkq"
+
+DEFAULT_FIELDS = ["w", "-", "-", "0", "1"]
+
+
+def load_fen(board: 'Board', fen: str, whites: Player, blacks: Player):
+    """Replaces the board pieces by the position of the FEN notation (see `Board.load_fen`)
+    """
+    from chess.pieces._piece import WithMovementObserver
+    from chess.pieces.king import King
+    from chess.pieces.pawn import Pawn
+    from chess.pieces.rook import Rook
+
+    fields = fen.split()
+    assert 1 <= len(fields) <= 6, "Invalid FEN: wrong number of fields."
+    placement, turn, castling, en_passant, halfmove_clock, fullmove = (
+        fields + DEFAULT_FIELDS[len(fields) - 1:]
+    )
+
+    geometry = board.geometry
+    ranks = placement.split("/")
+    assert len(ranks) == geometry.height, "Invalid FEN: wrong number of lines."
+
+    piece_types = {
+        piece_type.NOTATION: piece_type
+        for piece_type in board.piece_types()
+    }
+
+    board.empty()
+    for (rank_index, rank) in enumerate(ranks):
+        y_index = geometry.height - 1 - rank_index
+        x_index = 0
+        skip = ""
+        for char in rank + " ":
+            if char.isdigit():
+                skip += char
+                continue
+            if skip:
+                x_index += int(skip)
+                skip = ""
+            if char == " ":
+                break
+
+            piece_type = piece_types.get(char.lower())
+            assert piece_type is not None, f"Invalid FEN: unknown piece '{char}'."
+            assert geometry.contains(x_index, y_index), "Invalid FEN: too many cases in a line."
+
+            position = geometry.positions[geometry.square(x_index, y_index)]
+            piece_type(
+                board, whites if char.isupper() else blacks, position.x, position.raw_y
+            )  # type: ignore
+            x_index += 1
+
+        assert x_index == geometry.width, "Invalid FEN: wrong number of cases in a line."
+
+    assert turn in ("w", "b"), "Invalid FEN: the player to play must be 'w' or 'b'."
+    board.turn = Player.WHITES_DIRECTION if turn == "w" else Player.BLACKS_DIRECTION
+
+    assert castling == "-" or set(castling) <= set(CASTLING_LETTERS), "Invalid FEN: invalid castling rights."
+    rights = 0
+    for (bit, letter) in enumerate(CASTLING_LETTERS):
+        if letter in castling:
+            rights |= 1 << bit
+
+    # Seeding the first movements, from the castling rights and the pawns start lines
+    for piece in board.pieces:
+        if not isinstance(piece, WithMovementObserver):
+            continue
+
+        white = piece.player.is_white
+        home_y_index = 0 if white else geometry.height - 1
+        side_rights = (rights >> (0 if white else 2)) & 0b11
+
+        if isinstance(piece, Pawn):
+            has_moved = piece.position.y_index != (
+                1 if white else geometry.height - 2
+            )
+        elif isinstance(piece, King):
+            has_moved = not side_rights or piece.position.y_index != home_y_index
+        elif isinstance(piece, Rook):
+            corner_right = (
+                0b01 if piece.position.x_index == geometry.width - 1 else
+                0b10 if piece.position.x_index == 0 else 0
+            )
+            has_moved = not (
+                side_rights & corner_right
+                and piece.position.y_index == home_y_index
+            )
+        else:
+            has_moved = False
+
+        if has_moved:
+            piece.mark_as_moved()
+
+    assert board.castling_rights() == rights, "Invalid FEN: the castling rights do not match the kings and rooks."
+
+    if en_passant == "-":
+        board.en_passant = None
+    else:
+        assert len(en_passant) >= 2, "Invalid FEN: invalid en passant case."
+        board.en_passant = geometry.position(en_passant[0], int(en_passant[1:]))
+        assert board.en_passant is not None, "Invalid FEN: invalid en passant case."
+
+    assert halfmove_clock.isdigit() and fullmove.isdigit(), "Invalid FEN: invalid movements counters."
+    board.halfmove_clock = int(halfmove_clock)
+    board.first_fullmove = int(fullmove)
+
+
+def board_fen(board: 'Board'):
+    """Get the FEN notation of the board's position (see `Board.to_fen`)
+    """
+    geometry = board.geometry
+
+    ranks = []
+    for y_index in reversed(range(geometry.height)):
+        rank = ""
+        empty = 0
+        for x_index in range(geometry.width):
+            piece = board._occupancy_at(geometry.square(x_index, y_index))
+            if piece is None:
+                empty += 1
+                continue
+
+            if empty:
+                rank += str(empty)
+                empty = 0
+            rank += piece.NOTATION.upper() if piece.player.is_white else piece.NOTATION.lower()
+        ranks.append(rank + (str(empty) if empty else ""))
+
+    rights = board.castling_rights()
+    castling = "".join(
+        letter for (bit, letter) in enumerate(CASTLING_LETTERS)
+        if rights & (1 << bit)
+    )
+
+    return " ".join((
+        "/".join(ranks),
+        "w" if board.turn == Player.WHITES_DIRECTION else "b",
+        castling or "-",
+        str(board.en_passant) if board.en_passant else "-",
+        str(board.halfmove_clock),
+        str(board.fullmove_number),
+    ))
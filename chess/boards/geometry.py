@@ -0,0 +1,172 @@
+from functools import cache
+from chess.position import Position
+
+
+class Geometry:
+    """Describes the squares of a board shape.
+
+    Squares are numbered from the bottom left corner, line by line:
+    `square = y_index * width + x_index`. A set of squares is stored
+    as an integer mask where the bit `1 << square` is set for each square.
+
+    Use `Geometry.of` to get the (shared) geometry of a board shape.
+    """
+
+    def __init__(self, x_range: tuple[str, ...], y_range: tuple[int, ...]) -> None:
+        self.X_RANGE = x_range
+        self.Y_RANGE = y_range
+
+        self.width = len(x_range)
+        self.height = len(y_range)
+        self.size = self.width * self.height
+        self.full = (1 << self.size) - 1
+
+        # One shared position per square, indexed by square
+        self.positions = [
+            Position._of_geometry(self, square % self.width, square // self.width)
+            for square in range(self.size)
+        ]
+        self.__positions_by_xy = {
+            position.raw_xy: position
+            for position in self.positions
+        }
+
+        # Masks of the squares of each column (file) and line (rank)
+        self.files = [
+            sum(1 << self.square(x_index, y_index) for y_index in range(self.height))
+            for x_index in range(self.width)
+        ]
+        self.ranks = [
+            sum(1 << self.square(x_index, y_index) for x_index in range(self.width))
+            for y_index in range(self.height)
+        ]
+
+        self.__shift_sources: dict[tuple[int, int], int] = {}
+        self.__leaps: dict[tuple[tuple[int, int], ...], list[int]] = {}
+        self.__leaps_to: dict[tuple[tuple[int, int], ...], list[int]] = {}
+        self.__rays: dict[tuple[int, int], list[int]] = {}
+
+    @staticmethod
+    @cache
+    def of(x_range: tuple[str, ...], y_range: tuple[int, ...]) -> 'Geometry':
+        return Geometry(x_range, y_range)
+
+    def square(self, x_index: int, y_index: int):
+        return y_index * self.width + x_index
+
+    def position(self, x: str, y: int):
+        """Get the position at the given coordinates, or None if they are not in the geometry
+        """
+        return self.__positions_by_xy.get((x, y))
+
+    def square_of(self, position: Position):
+        if position.geometry is self:
+            return position.square
+
+        found = self.position(*position.raw_xy)
+        assert found is not None, "The position is not in this geometry."
+        return found.square
+
+    def contains(self, x_index: int, y_index: int):
+        return 0 <= x_index < self.width and 0 <= y_index < self.height
+
+    def shift(self, mask: int, dx: int, dy: int):
+        """Moves every square of the mask by (dx, dy), dropping the ones leaving the board
+        """
+        source = self.__shift_sources.get((dx, dy))
+        if source is None:
+            source = self.__shift_sources[(dx, dy)] = self.__shift_source(
+                dx, dy
+            )
+
+        offset = dx + dy * self.width
+        mask &= source
+        return mask << offset if offset >= 0 else mask >> -offset
+
+    def __shift_source(self, dx: int, dy: int):
+        """Mask of the squares that are still on the board once moved by (dx, dy)
+        """
+        source = 0
+        for y_index in range(self.height):
+            for x_index in range(self.width):
+                if self.contains(x_index + dx, y_index + dy):
+                    source |= 1 << self.square(x_index, y_index)
+        return source
+
+    def leaps(self, steps: tuple[tuple[int, int], ...]):
+        """Get the table of the squares reached by the given leaps, as a mask per starting square.
+        Tables are computed once per geometry and leaps pattern.
+        """
+        table = self.__leaps.get(steps)
+        if table is None:
+            table = self.__leaps[steps] = [
+                self.__leap_mask(square, steps)
+                for square in range(self.size)
+            ]
+        return table
+
+    def leaps_to(self, steps: tuple[tuple[int, int], ...]):
+        """Get the table of the squares a leap can come from, as a mask per reached square
+        """
+        table = self.__leaps_to.get(steps)
+        if table is None:
+            table = self.__leaps_to[steps] = self.leaps(
+                tuple((-dx, -dy) for (dx, dy) in steps)
+            )
+        return table
+
+    def __leap_mask(self, square: int, steps: tuple[tuple[int, int], ...]):
+        x_index, y_index = square % self.width, square // self.width
+        mask = 0
+        for (dx, dy) in steps:
+            if self.contains(x_index + dx, y_index + dy):
+                mask |= 1 << self.square(x_index + dx, y_index + dy)
+        return mask
+
+    def rays(self, dx: int, dy: int):
+        """Get the table of the squares crossed by a ray going in the (dx, dy) direction,
+        as a mask per starting square (the starting square is not part of the ray).
+        """
+        table = self.__rays.get((dx, dy))
+        if table is None:
+            table = self.__rays[(dx, dy)] = [
+                self.__ray_mask(square, dx, dy)
+                for square in range(self.size)
+            ]
+        return table
+
+    def __ray_mask(self, square: int, dx: int, dy: int):
+        x_index, y_index = square % self.width, square // self.width
+        mask = 0
+        while self.contains(x_index + dx, y_index + dy):
+            x_index, y_index = x_index + dx, y_index + dy
+            mask |= 1 << self.square(x_index, y_index)
+        return mask
+
+    def ray_attacks(self, square: int, dx: int, dy: int, occupied: int):
+        """Get the squares reached by a ray from the square, stopping at (and including) the first occupied square
+        """
+        table = self.rays(dx, dy)
+        ray = table[square]
+        blockers = ray & occupied
+        if not blockers:
+            return ray
+
+        return ray ^ table[self.nearest(blockers, dx, dy)]
+
+    def nearest(self, mask: int, dx: int, dy: int):
+        """Get the first square of the mask met when going in the (dx, dy) direction (the mask must be on a ray)
+        """
+        # Squares numbers grow along the ray when it goes up or right
+        if dx + dy * self.width > 0:
+            return (mask & -mask).bit_length() - 1
+        return mask.bit_length() - 1
+
+    @staticmethod
+    def squares(mask: int):
+        """Iterates over the squares of the mask, from the lowest to the highest
+        """
+        while mask:
+            lowest = mask & -mask
+            yield lowest.bit_length() - 1
+            mask ^= lowest
@@ -0,0 +1,87 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from chess.boards.geometry import Geometry
+    from chess.pieces._piece import Piece
+
+Signature = tuple[tuple[tuple[str, int], ...], ...]
+
+
+def _insufficient_signatures(max_bishops: int) -> frozenset[Signature]:
+    """Get the signatures where no player can checkmate the other: no piece,
+    a single knight, or bishops all on the same square color (on either side)
+    """
+    signatures: set[Signature] = {((), ()), ((), (("n", 1),))}
+    for kind in ("b0", "b1"):
+        for first in range(max_bishops + 1):
+            for second in range(first, max_bishops + 1):
+                signatures.add(tuple(sorted((
+                    ((kind, first),) if first else (),
+                    ((kind, second),) if second else ()
+                ))))
+    return frozenset(signatures)
+
+
+class Material:
+    """Counts of the playable pieces of each player, by kind.
+
+    A kind is the notation of the piece. Pieces bound to the color of
+    their square (see `Piece.SQUARE_COLOR_BOUND`) get the color appended:
+    a bishop is either `b0` or `b1`. Kings are not counted.
+
+    The Board keeps it in sync with its pieces.
+    """
+
+    # Most bishops of a player: its own two and its promoted pawns
+    MAX_BISHOPS = 10
+    # Signatures where no player can checkmate the other
+    INSUFFICIENT = _insufficient_signatures(MAX_BISHOPS)
+
+    def __init__(self, geometry: 'Geometry') -> None:
+        self.geometry = geometry
+        self.counts: dict[int, dict[str, int]] = {1: {}, -1: {}}
+        self.__signature: Signature | None = None
+
+    def kind(self, piece: 'Piece', square: int):
+        if not piece.SQUARE_COLOR_BOUND:
+            return piece.NOTATION
+
+        x_index, y_index = square % self.geometry.width, square // self.geometry.width
+        return f"{piece.NOTATION}{(x_index + y_index) % 2}"
+
+    def add(self, piece: 'Piece', square: int):
+        from chess.pieces.king import King
+        if isinstance(piece, King):
+            return
+
+        counts = self.counts[piece.player.direction]
+        kind = self.kind(piece, square)
+        counts[kind] = counts.get(kind, 0) + 1
+        self.__signature = None
+
+    def remove(self, piece: 'Piece', square: int):
+        from chess.pieces.king import King
+        if isinstance(piece, King):
+            return
+
+        counts = self.counts[piece.player.direction]
+        kind = self.kind(piece, square)
+        counts[kind] -= 1
+        if not counts[kind]:
+            del counts[kind]
+        self.__signature = None
+
+    def of(self, direction: int):
+        """Get the signature of a player's material: its (kind, count) pairs, sorted by kind
+        """
+        return tuple(sorted(self.counts[direction].items()))
+
+    def signature(self):
+        """Get the signature of the material on the board, regardless of the players' colors
+        """
+        if self.__signature is None:
+            self.__signature = tuple(sorted((self.of(1), self.of(-1))))
+        return self.__signature
+
+    def is_insufficient(self):
+        return self.signature() in self.INSUFFICIENT
@@ -2,33 +2,22 @@ from chess.boards.board import Board
 from chess.pieces.knight import Knight
 from chess.pieces.rook import Rook
 from chess.players._player import Player
-from chess.position import Position
 
 
 class OneDymentionKnight(Knight):
-    def contesting_positions(self) -> list[Position]:
-        contesting = []
-
-        for jump_dir in (-1, 1):
-            position = self.position.move().addX(2, jump_dir).safe_position()
-            if position is None:
-                continue
-
-            if (
-                self.board.pieces.at(position).of(
-                    self.player
-                ).exist()
-            ):
-                continue
-
-            contesting.append(position)
-        return contesting
+    LEAPS = ((-2, 0), (2, 0))
 
 
 class OneDymentionBoard(Board):
     X_RANGE: list[str] = list("abcdefgh")
     Y_RANGE: list[int] = [1]
 
+    def piece_types(self):
+        return [
+            OneDymentionKnight if piece_type is Knight else piece_type
+            for piece_type in super().piece_types()
+        ]
+
     def setup(self, whites: Player, blacks: Player):
         self.empty()
 
@@ -0,0 +1,56 @@
+from functools import cache
+from random import Random
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from chess.boards.geometry import Geometry
+    from chess.pieces._piece import Piece
+
+
+class ZobristKeys:
+    """Random keys used to hash board positions.
+
+    The keys are generated from a fixed seed, so every process
+    gets the same keys for the same board geometry.
+    """
+
+    CASTLING_RIGHTS = 4
+
+    def __init__(self, geometry: 'Geometry') -> None:
+        self.geometry = geometry
+
+        random = Random(f"zobrist:{geometry.width}x{geometry.height}")
+        self.side = random.getrandbits(64)
+
+        rights_keys = [random.getrandbits(64) for _ in range(self.CASTLING_RIGHTS)]
+        self.castling = [0] * (1 << self.CASTLING_RIGHTS)
+        for rights in range(len(self.castling)):
+            for (bit, key) in enumerate(rights_keys):
+                if rights & (1 << bit):
+                    self.castling[rights] ^= key
+
+        # Pawns that have not moved yet, as they can move by two squares
+        self.unmoved_pawns = [random.getrandbits(64) for _ in range(geometry.size)]
+
+        self.__pieces: dict[tuple[int, str], list[int]] = {}
+
+    @staticmethod
+    @cache
+    def of(geometry: 'Geometry') -> 'ZobristKeys':
+        return ZobristKeys(geometry)
+
+    def pieces(self, direction: int, notation: str):
+        """Get the keys of a piece type, indexed by square
+        """
+        keys = self.__pieces.get((direction, notation))
+        if keys is None:
+            random = Random(
+                f"zobrist:{self.geometry.width}x{self.geometry.height}:{direction}:{notation}"
+            )
+            keys = self.__pieces[(direction, notation)] = [
+                random.getrandbits(64) for _ in range(self.geometry.size)
+            ]
+        return keys
+
+    def piece(self, piece: 'Piece', square: int):
+        return self.pieces(piece.player.direction, piece.NOTATION)[square]
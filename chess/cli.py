@@ -0,0 +1,33 @@
+"""Helpers shared by the command line entries of the modules"""
+
+
+def option(args: list[str], name: str):
+    """Get the value of a command line option, and the other arguments
+    """
+    if name not in args:
+        return None, args
+
+    index = args.index(name)
+    assert index + 1 < len(args), f"Valeur manquante pour {name}"
+    return args[index + 1], args[:index] + args[index + 2:]
+
+
+def setup_game(args: list[str]):
+    """Get the game in the position given by the arguments: `[--fen <fen>] [movements...]`
+    """
+    from chess.game.game import ChessGame
+    from chess.players.physical import PhysicalPlayer
+
+    fen, movements = option(args, "--fen")
+    whites, blacks = PhysicalPlayer(1), PhysicalPlayer(-1)
+
+    game = (
+        ChessGame((whites, blacks)) if fen is None
+        else ChessGame.from_fen(whites, blacks, fen)
+    ).start()
+
+    for movement in movements:
+        game.play(movement)
+
+    print(game.board.with_coordonates())
+    return game, not (fen or movements)
@@ -0,0 +1,207 @@
+"""Binary archive of games, read through a memory map to replay any game by its number.
+
+    header      MAGIC, VERSION
+    records     one per game: RECORD header, tags (UTF-8), movements (16 bits codes)
+    index       the offset of each record (8 bytes each)
+    trailer     the number of games and the offset of the index
+
+Every integer is little-endian. The tags are written as "name\\tvalue" lines,
+a game starting from another position than the usual one has a "FEN" tag.
+"""
+
+from array import array
+from mmap import ACCESS_READ, mmap
+from struct import Struct
+from sys import byteorder
+from time import perf_counter
+from typing import TYPE_CHECKING, BinaryIO, Iterable
+from chess.game.pgn import RESULTS, new_game, replay_moves
+from chess.players._player import Player
+
+if TYPE_CHECKING:
+    from chess.game.game import ChessGame
+
+MAGIC = b"CCAR"
+VERSION = 1
+
+HEADER = Struct("<4sH")
+# Result, tags size, movements count
+RECORD = Struct("<BII")
+OFFSET = Struct("<Q")
+# Games count, index offset
+TRAILER = Struct("<QQ")
+
+
+def _little_endian(codes: array):
+    if byteorder == "big":
+        codes = array("H", codes)
+        codes.byteswap()
+    return codes
+
+
+class ArchiveWriter:
+    """Writes games to a new archive file, one after the other.
+    The index is written when the writer is closed.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.__file: BinaryIO = open(path, "wb")
+        self.__file.write(HEADER.pack(MAGIC, VERSION))
+        self.__offsets = array("Q")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def __len__(self):
+        return len(self.__offsets)
+
+    def add(self, codes: Iterable[int], result="*", tags: dict[str, str] | None = None):
+        """Adds a game from its movements codes (see `chess.movement.encoding`)
+        """
+        codes = _little_endian(array("H", codes))
+        encoded_tags = "\n".join(
+            f"{name}\t{' '.join(value.split())}" for (name, value) in (tags or {}).items()
+        ).encode("utf-8")
+
+        self.__offsets.append(self.__file.tell())
+        self.__file.write(RECORD.pack(RESULTS.index(result), len(encoded_tags), len(codes)))
+        self.__file.write(encoded_tags)
+        self.__file.write(codes.tobytes())
+
+    def add_game(self, game: 'ChessGame', tags: dict[str, str] | None = None):
+        """Adds the movements played in the game.
+        A game not started from the usual position must give its "FEN" tag.
+        """
+        from chess.movement.encoding import encode_move
+
+        self.add(
+            (encode_move(movement) for movement in game.board.moves.iter()),
+            game.result,
+            tags
+        )
+
+    def close(self):
+        if self.__file.closed:
+            return
+
+        index_offset = self.__file.tell()
+        self.__file.write(_little_endian(self.__offsets).tobytes())
+        self.__file.write(TRAILER.pack(len(self.__offsets), index_offset))
+        self.__file.close()
+
+
+class ArchivedGame:
+    def __init__(self, index: int, tags: dict[str, str], result: str, codes: array) -> None:
+        self.index = index
+        self.tags = tags
+        self.result = result
+        self.codes = codes
+
+    def replay(self, whites: Player | None = None, blacks: Player | None = None):
+        """Replays the movements on a new board, and get the game
+        """
+        from chess.movement.encoding import decode_move
+
+        game = new_game(self.tags, whites, blacks).start()
+        for _ in replay_moves(game, self.codes, lambda code, game: decode_move(code, game.board)):
+            pass
+        return game
+
+
+class GameArchive:
+    """Reads an archive through a memory map: only the read games are loaded.
+    """
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as file:
+            self.__map = mmap(file.fileno(), 0, access=ACCESS_READ)
+
+        magic, version = HEADER.unpack_from(self.__map, 0)
+        assert magic == MAGIC, "The file is not a games archive."
+        assert version == VERSION, f"Unsupported archive version: {version}"
+
+        self.__count, self.__index_offset = TRAILER.unpack_from(
+            self.__map, len(self.__map) - TRAILER.size
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def __len__(self):
+        return self.__count
+
+    def __getitem__(self, index: int):
+        if index < 0:
+            index += self.__count
+        if not 0 <= index < self.__count:
+            raise IndexError("Game index out of range")
+
+        (offset,) = OFFSET.unpack_from(self.__map, self.__index_offset + index * OFFSET.size)
+        result, tags_size, moves = RECORD.unpack_from(self.__map, offset)
+
+        start = offset + RECORD.size
+        tags = dict(
+            line.split("\t", 1)
+            for line in self.__map[start:start + tags_size].decode("utf-8").splitlines()
+        )
+
+        start += tags_size
+        codes = array("H")
+        codes.frombytes(self.__map[start:start + moves * 2])
+        return ArchivedGame(index, tags, RESULTS[result], _little_endian(codes))
+
+    def __iter__(self):
+        for index in range(self.__count):
+            yield self[index]
+
+    def close(self):
+        self.__map.close()
+
+
+def run(args: list[str]):
+    """Command line entry:
+    `--archive <file.pgn> <archive> [--processes <count>]` writes the valid games of the PGN file to the archive, in the order of the file (with their announced result),
+    `--archive <archive> --game <number>` replays a game of the archive.
+    """
+    assert len(args) >= 2, "Usage : --archive <fichier.pgn> <archive> [--processes <nombre>] | --archive <archive> --game <numéro>"
+
+    if args[1] == "--game":
+        number = int(args[2])
+        start = perf_counter()
+        with GameArchive(args[0]) as archive:
+            archived = archive[number - 1]
+            game = archived.replay()
+
+        duration = perf_counter() - start
+        print(f"Partie {number}/{len(archive)} : {archived.tags.get('White', '?')} - {archived.tags.get('Black', '?')}")
+        print(" ".join(movement.san or "" for movement in game.board.moves.iter()), archived.result)
+        print(game.board.with_coordonates())
+        print(f"Rejouée en {duration * 1000:.1f}ms")
+        return
+
+    from chess.game.pgn import replay_stream
+    from chess.cli import option
+
+    processes, args = option(args, "--processes")
+
+    errors = 0
+    start = perf_counter()
+    with open(args[0], encoding="utf-8", errors="replace") as file, ArchiveWriter(args[1]) as writer:
+        for result in replay_stream(file, None if processes is None else int(processes)):
+            if result.error is None:
+                writer.add(
+                    result.codes,
+                    result.result if result.result in RESULTS else result.outcome,
+                    result.tags
+                )
+            else:
+                errors += 1
+        games = len(writer)
+
+    print(f"{games} parties archivées ({errors} en erreur) en {perf_counter() - start:.2f}s")
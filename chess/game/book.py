@@ -0,0 +1,151 @@
+"""Polyglot opening books, read through a memory map.
+
+A book is a list of 16 bytes entries, sorted by position key (big-endian):
+the Polyglot hash of the position (see `PolyglotKeys`), the movement, its weight and a learning value.
+"""
+
+from mmap import ACCESS_READ, mmap
+from random import Random
+from struct import Struct
+from time import perf_counter
+from typing import TYPE_CHECKING
+from chess.boards.polyglot import PolyglotKeys
+
+if TYPE_CHECKING:
+    from chess.boards.board import Board
+    from chess.movement.movement import Movement
+    from chess.pieces._piece import Piece
+
+ENTRY = Struct(">QHHI")
+KEY = Struct(">Q")
+
+
+class BookMove:
+    def __init__(self, movement: 'Movement', promote_as: 'type[Piece] | None', weight: int, learn=0) -> None:
+        self.movement = movement
+        self.promote_as = promote_as
+        self.weight = weight
+        self.learn = learn
+
+    def __str__(self) -> str:
+        return f"{self.movement.from_position}{self.movement.to_position}" + (
+            self.promote_as.NOTATION if self.promote_as else ""
+        ) + f" ({self.weight})"
+
+
+class OpeningBook:
+    """Reads a Polyglot book: the entries of a position are found by a binary search on the mapped file,
+    nothing is loaded in memory.
+    """
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as file:
+            self.__map = mmap(file.fileno(), 0, access=ACCESS_READ)
+        assert len(self.__map) % ENTRY.size == 0, "The file is not a Polyglot book."
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def __len__(self):
+        return len(self.__map) // ENTRY.size
+
+    def __key_at(self, index: int) -> int:
+        return KEY.unpack_from(self.__map, index * ENTRY.size)[0]
+
+    def entries(self, key: int):
+        """Iterates over the (movement, weight, learn) entries of the position key
+        """
+        low, high = 0, len(self)
+        while low < high:
+            middle = (low + high) // 2
+            if self.__key_at(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+
+        for index in range(low, len(self)):
+            entry_key, move, weight, learn = ENTRY.unpack_from(self.__map, index * ENTRY.size)
+            if entry_key != key:
+                break
+            yield move, weight, learn
+
+    def moves(self, board: 'Board') -> list[BookMove]:
+        """Get the book movements of the player whose turn it is (the illegal ones are left out)
+        """
+        if not PolyglotKeys.supports(board):
+            return []
+
+        found: list[BookMove] = []
+        for (move, weight, learn) in self.entries(PolyglotKeys.hash(board)):
+            decoded = self.__decode(move, board)
+            if decoded is not None:
+                found.append(BookMove(*decoded, weight, learn))
+        return found
+
+    def choose(self, board: 'Board', random: Random | None = None) -> BookMove | None:
+        """Get a book movement picked according to the weights, or None if the position is not in the book
+        """
+        moves = self.moves(board)
+        weighted = [move for move in moves if move.weight] or moves
+        if not weighted:
+            return None
+
+        return (random or Random()).choices(
+            weighted, [move.weight or 1 for move in weighted]
+        )[0]
+
+    @staticmethod
+    def __decode(move: int, board: 'Board'):
+        from chess.movement.encoding import promotion_types
+        from chess.movement.movement import Movement
+        from chess.pieces.king import CastlingDirection, King
+        from chess.pieces.rook import Rook
+
+        to_square = (move >> 3 & 7) * 8 + (move & 7)
+        from_square = (move >> 9 & 7) * 8 + (move >> 6 & 7)
+        promotion = move >> 12 & 7
+
+        piece = board._occupancy_at(from_square)
+        if piece is None or piece.player.direction != board.turn or promotion > 4:
+            return None
+
+        # Castling is written as the king moving to its rook
+        target = board._occupancy_at(to_square)
+        if isinstance(piece, King) and isinstance(target, Rook) and target.player is piece.player:
+            castle_movement = piece.get_castle_movement(
+                CastlingDirection.KING if to_square > from_square else CastlingDirection.QUEEN
+            )
+            return None if castle_movement is None else (castle_movement, None)
+
+        to_position = board.position_of(to_square)
+        if not piece.can_move_to(to_position):
+            return None
+        return (
+            Movement(piece.position, to_position),
+            promotion_types()[promotion - 1] if promotion else None
+        )
+
+    def close(self):
+        self.__map.close()
+
+
+def run(args: list[str]):
+    """Command line entry: `--book <file.bin> [--fen <fen>] [moves...]`
+    Prints the book movements of the position.
+    """
+    assert args, "Usage : --book <fichier.bin> [--fen <fen>] [coups...]"
+    from chess.cli import setup_game
+
+    game, _ = setup_game(args[1:])
+    with OpeningBook(args[0]) as book:
+        start = perf_counter()
+        moves = book.moves(game.board)
+        duration = perf_counter() - start
+
+        print(f"Clé : {PolyglotKeys.hash(game.board):016x}")
+        for move in sorted(moves, key=lambda move: -move.weight):
+            print(move)
+        print(f"{len(moves)} coups trouvés parmi {len(book)} en {duration * 1e6:.0f}µs")
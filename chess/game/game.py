@@ -4,8 +4,10 @@ from chess.boards.normal import NormalBoard
 from chess.players._player import DrawReason, Player
 
 if TYPE_CHECKING:
+    from chess.game.pgn import PGNWriter
     from chess.movement.board_movement import BoardMovement
     from chess.movement.movement import Movement
+    from chess.pieces._piece import Piece
 
 
 class ChessGame:
@@ -28,9 +30,21 @@ class ChessGame:
         self.__state = "empty"
         self.__winner: None | Player = None
         self.__draw: DrawReason | Literal[False] = False
+        self.__recorder: 'PGNWriter | None' = None
 
         if board is None:
             self.setup_board()
+        self.__check_first_player()
+
+    @staticmethod
+    def from_fen(whites: Player, blacks: Player, fen: str):
+        """Create a game from the position written in FEN (the first player to play is read from it)
+        """
+        board = NormalBoard.from_fen(fen, whites, blacks)
+        return ChessGame(
+            (whites, blacks) if board.turn == whites.direction else (blacks, whites),
+            board
+        )
 
     def now_playing(self):
         return self.players[len(self.board.moves) % 2]
@@ -45,6 +59,25 @@ class ChessGame:
     def has_winner_or_draw(self):
         return self.__winner or self.__draw
 
+    @property
+    def result(self):
+        """The result of the game as written in PGN: "1-0", "0-1", "1/2-1/2" or "*" while it is not finished
+        """
+        if self.__winner is not None:
+            return "1-0" if self.__winner.is_white else "0-1"
+        return "1/2-1/2" if self.__draw else "*"
+
+    def record_to(self, writer: 'PGNWriter', tags: dict[str, str] | None = None):
+        """Writes the game to the PGN writer: each movement is added when played, and the game is written once finished.
+        """
+        writer.begin(self.board, {
+            "White": str(self.white_player),
+            "Black": str(self.black_player),
+            **(tags or {})
+        })
+        self.__recorder = writer
+        return self
+
     @property
     def state(self):
         return self.__state
@@ -128,11 +161,12 @@ class ChessGame:
 
         return self.autoplay("Echec !" if opponent_consequences.with_check().is_checked else "")
 
-    def play(self, move: 'Movement|str') -> 'BoardMovement':
+    def play(self, move: 'Movement|str', promote_as: 'type[Piece] | None' = None) -> 'BoardMovement':
         """Play and register the move, then check for check, checkmate and draw.
 
         Args:
             move (Movement|str): The movement to execute
+            promote_as (type[Piece] | None, optional): The piece a promoted pawn becomes, instead of asking the player. Defaults to None.
 
         Raises:
             err: If the game is not playing or there is a move error
@@ -153,16 +187,31 @@ class ChessGame:
 
         movement = request.in_board(self.board)
 
+        from chess.pieces.pawn import Pawn
+        pawn = self.board._occupancy_at(
+            self.board.geometry.square_of(movement.from_position)
+        ) if promote_as is not None else None
+        if isinstance(pawn, Pawn):
+            forced = pawn.forced_promotion
+            pawn.force_promotion_as(promote_as)
+
         try:
             movement.validate(True)
         except AssertionError as err:
             movement.unvalidate(True)
             raise err
+        finally:
+            # The piece is only forced for this movement
+            if isinstance(pawn, Pawn):
+                pawn.force_promotion_as(forced or "ask")
 
         opponent_status = movement.consequences('opponent')
         assert opponent_status is not None, "Cannot validate status of the opponent."
         opponent_status.with_checkmate().with_draw()
 
+        if self.__recorder is not None:
+            self.__recorder.add(movement)
+
         if opponent_status.is_check_mate:
             self.__winner = player
             self.board.get_king_of(
@@ -173,11 +222,28 @@ class ChessGame:
             self.__draw = opponent_status.is_draw
             self.stop()
 
+        if self.__recorder is not None and self.has_winner_or_draw:
+            self.__recorder.end(self.result)
+            self.__recorder = None
+
         return movement
 
+    def cancel(self):
+        """Cancels the last played movement
+        """
+        self.board.moves.last().cancel()
+        if self.__recorder is not None:
+            self.__recorder.remove_last()
+
     def setup_board(self):
         assert self.white_player.is_black != self.black_player.is_black, "Players has the same direction ! Game cannot init the board."
 
         self.board.setup(self.white_player, self.black_player)
+        self.__check_first_player()
 
         self.__state = "ready"
+
+    def __check_first_player(self):
+        # The turn is read from the board (a FEN position gives it), the players must be ordered accordingly
+        assert len(self.board.moves) or self.board.turn == self.players[0].direction, \
+            "The first player is not the one whose turn it is on the board."
@@ -0,0 +1,410 @@
+"""Portable Game Notation (PGN): reading, writing and replaying games"""
+
+from array import array
+from multiprocessing import Process, Queue, cpu_count
+from queue import Empty
+from re import compile as reg_compile
+from threading import Thread
+from time import perf_counter
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, TextIO, TypeVar
+from chess.players._player import Player
+
+if TYPE_CHECKING:
+    from chess.boards.board import Board
+    from chess.game.game import ChessGame
+    from chess.movement.board_movement import BoardMovement
+    from chess.movement.movement import Movement
+    from chess.pieces._piece import Piece
+
+Move = TypeVar('Move')
+
+TAG_PATTERN = reg_compile(r'^\[\s*(\w+)\s+"((?:[^"\\]|\\.)*)"\s*\]$')
+# Comments, variations, annotations glyphs, moves numbers and tokens
+TOKEN_PATTERN = reg_compile(r'\{[^}]*\}|;[^\n]*|\(|\)|\$\d+|\d+\.+|[^\s(){};]+')
+
+RESULTS = ("1-0", "0-1", "1/2-1/2", "*")
+SEVEN_TAGS = ("Event", "Site", "Date", "Round", "White", "Black", "Result")
+
+
+class PGNGame:
+    def __init__(self, tags: dict[str, str], moves: list[str], result: str) -> None:
+        self.tags = tags
+        self.moves = moves
+        self.result = result
+
+    @staticmethod
+    def parse(text: str) -> 'PGNGame':
+        """Parse the text of a single game (tags and movements)
+        """
+        tags: dict[str, str] = {}
+        movetext: list[str] = []
+
+        for line in text.splitlines():
+            stripped = line.strip()
+            if stripped.startswith("%"):
+                continue
+
+            tag = TAG_PATTERN.match(stripped)
+            if tag is not None:
+                tags[tag.group(1)] = tag.group(2).replace('\\"', '"')
+            else:
+                movetext.append(line)
+
+        moves: list[str] = []
+        result = tags.get("Result", "*")
+        variations = 0
+
+        for token in TOKEN_PATTERN.findall("\n".join(movetext)):
+            if token == "(":
+                variations += 1
+            elif token == ")":
+                variations = max(variations - 1, 0)
+            elif variations or token[0] in "{;$" or token[0].isdigit() and token[-1] == ".":
+                continue
+            elif token in RESULTS:
+                result = token
+            else:
+                moves.append(token.replace("e.p.", "").rstrip("!?"))
+
+        return PGNGame(tags, moves, result)
+
+
+def split_games(lines: Iterable[str]) -> Iterator[str]:
+    """Splits a stream of PGN lines into the texts of each game, without reading the whole stream
+    """
+    game: list[str] = []
+    has_movetext = False
+
+    for line in lines:
+        stripped = line.strip()
+        if stripped.startswith("[") and has_movetext:
+            yield "".join(game)
+            game = []
+            has_movetext = False
+
+        if stripped and not stripped.startswith(("[", "%")):
+            has_movetext = True
+        game.append(line if line.endswith("\n") else line + "\n")
+
+    if has_movetext:
+        yield "".join(game)
+
+
+class ReplayResult:
+    def __init__(self, index: int, tags: dict[str, str], result: str) -> None:
+        self.index = index
+        self.tags = tags
+        self.result = result
+
+        self.moves = 0
+        # The movements encoded in 16 bits (see `chess.movement.encoding`)
+        self.codes = array("H")
+        self.outcome = "*"
+        self.error: str | None = None
+
+    def __str__(self) -> str:
+        players = f"{self.tags.get('White', '?')} - {self.tags.get('Black', '?')}"
+        if self.error is not None:
+            return f"Partie {self.index + 1} ({players}) : erreur au coup {self.moves + 1}, {self.error}"
+
+        return f"Partie {self.index + 1} ({players}) : {self.moves} coups, {self.outcome}" + (
+            "" if self.result in ("*", self.outcome) else f" (annoncé : {self.result})"
+        )
+
+
+def new_game(tags: dict[str, str], whites: Player | None = None, blacks: Player | None = None) -> 'ChessGame':
+    """Creates the game to replay a recorded one: from the position of its FEN tag, if any
+    """
+    from chess.game.game import ChessGame
+
+    whites = whites or Player(Player.WHITES_DIRECTION)  # type: ignore
+    blacks = blacks or Player(Player.BLACKS_DIRECTION)  # type: ignore
+    return ChessGame.from_fen(whites, blacks, tags["FEN"]) \
+        if "FEN" in tags else ChessGame((whites, blacks))
+
+
+def replay_moves(
+        chess_game: 'ChessGame',
+        moves: Iterable[Move],
+        decode: 'Callable[[Move, ChessGame], tuple[Movement, type[Piece] | None]]'
+) -> 'Iterator[BoardMovement]':
+    """Plays the recorded movements, yielding each one once played.
+
+    Args:
+        chess_game (ChessGame): The started game
+        moves (Iterable[Move]): The recorded movements (as SAN, codes...)
+        decode (Callable): Get the movement to play, and the piece a pawn is promoted as, from a recorded one
+    """
+    for move in moves:
+        # Draws by repetition or without captures are only claimed in recorded games
+        if not (chess_game.is_playing or isinstance(chess_game.has_winner_or_draw, Player)):
+            chess_game.resume()
+
+        yield chess_game.play(*decode(move, chess_game))
+
+
+def _decode_san(move: str, chess_game: 'ChessGame') -> 'tuple[Movement, type[Piece] | None]':
+    from chess.movement.board_movement import BoardMovement
+    from chess.pieces.pawn import Pawn
+    from chess.pieces.queen import Queen
+
+    board = chess_game.board
+    movement = BoardMovement.decode(move, board, chess_game.now_playing())
+    assert movement is not False, f"mouvement invalide : {move}"
+
+    promote_as = None
+    piece = board._occupancy_at(board.geometry.square_of(movement.from_position))
+    if isinstance(piece, Pawn) and piece.require_promotion(movement):
+        promotion = BoardMovement.parse(move).group('promotion')  # type: ignore
+        promote_as = next(
+            (
+                piece_type for piece_type in board.piece_types()
+                if promotion and piece_type.NOTATION == promotion.lower()
+            ),
+            Queen
+        )
+    return movement, promote_as
+
+
+def replay(game: PGNGame, index=0) -> ReplayResult:
+    """Replays the game movements on a new board (from its FEN tag, if any), to validate them
+    """
+    from chess.movement.encoding import encode_move
+
+    result = ReplayResult(index, game.tags, game.result)
+    try:
+        chess_game = new_game(game.tags).start()
+        for movement in replay_moves(chess_game, game.moves, _decode_san):
+            result.codes.append(encode_move(movement))
+            result.moves += 1
+
+        result.outcome = chess_game.result
+    # Any error only invalidates its game
+    except Exception as err:  # pylint: disable=broad-exception-caught
+        result.error = str(err.args[0]) if err.args else type(err).__name__
+
+    return result
+
+
+class PGNWriter:
+    """Writes games in PGN to a text output (as an opened file), one after the other.
+
+    The movements of the current game are kept as SAN until it ends, as they can still be canceled.
+    Only then is the game written, so that the output always holds complete games.
+    """
+    LINE_LENGTH = 80
+
+    def __init__(self, output: TextIO) -> None:
+        self.output = output
+        self.games = 0
+
+        self.__tags: dict[str, str] = {}
+        self.__moves: list[str] = []
+        self.__first_fullmove = 1
+        self.__first_is_white = True
+
+    def begin(self, board: 'Board', tags: dict[str, str] | None = None):
+        """Starts a new game, from the current position of the board
+        """
+        from chess.boards.fen import START_FEN
+
+        self.__tags = {tag: "?" for tag in SEVEN_TAGS}
+        self.__tags["Result"] = "*"
+        self.__tags.update(tags or {})
+
+        fen = board.to_fen()
+        if fen != START_FEN:
+            self.__tags["SetUp"] = "1"
+            self.__tags["FEN"] = fen
+
+        self.__moves = []
+        self.__first_fullmove = board.fullmove_number
+        self.__first_is_white = board.turn == Player.WHITES_DIRECTION
+
+    def add(self, movement: 'BoardMovement'):
+        """Adds a played movement to the current game
+        """
+        assert movement.san is not None, "The movement has not been played."
+        self.__moves.append(movement.san)
+
+    def remove_last(self):
+        """Removes the last movement of the current game (when it is canceled)
+        """
+        assert self.__moves, "No movements in the game."
+        self.__moves.pop()
+
+    def end(self, result="*"):
+        """Writes the current game with its result
+        """
+        assert result in RESULTS, f"Invalid result: {result}"
+        self.__tags["Result"] = result
+
+        for tag, value in self.__tags.items():
+            escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+            self.output.write(f'[{tag} "{escaped}"]\n')
+        self.output.write("\n")
+
+        line = ""
+        for token in self.__movetext(result):
+            if line and len(line) + 1 + len(token) > self.LINE_LENGTH:
+                self.output.write(line + "\n")
+                line = token
+            else:
+                line = f"{line} {token}" if line else token
+        self.output.write(line + "\n\n")
+
+        self.games += 1
+        self.__moves = []
+
+    def write_game(self, game: 'ChessGame', tags: dict[str, str] | None = None):
+        """Writes a game at once, from the movements played on its board.
+        A game not started from the usual position must give its "FEN" tag.
+        """
+        board = game.board
+        moves = list(board.moves.iter())
+
+        # Going back to the position the game started from
+        is_white = board.turn == Player.WHITES_DIRECTION
+        if len(moves) % 2:
+            is_white = not is_white
+        self.__first_is_white = is_white
+        self.__first_fullmove = board.fullmove_number - (
+            len(moves) + (not is_white)
+        ) // 2
+
+        self.__tags = {tag: "?" for tag in SEVEN_TAGS}
+        self.__tags.update({
+            "White": str(game.white_player),
+            "Black": str(game.black_player),
+            **(tags or {})
+        })
+        if "FEN" in self.__tags:
+            self.__tags["SetUp"] = "1"
+
+        self.__moves = []
+        for movement in moves:
+            self.add(movement)
+        self.end(game.result)
+
+    def __movetext(self, result: str):
+        number = self.__first_fullmove
+        is_white = self.__first_is_white
+        if self.__moves and not is_white:
+            yield f"{number}..."
+
+        for san in self.__moves:
+            if is_white:
+                yield f"{number}."
+            yield san
+
+            if not is_white:
+                number += 1
+            is_white = not is_white
+        yield result
+
+
+def _replay_worker(tasks: Queue, results: Queue):
+    while (task := tasks.get()) is not None:
+        index, text = task
+        results.put(replay(PGNGame.parse(text), index))
+    results.put(None)
+
+
+def _feed(lines: Iterable[str], tasks: Queue, workers: int):
+    for task in enumerate(split_games(lines)):
+        tasks.put(task)
+    for _ in range(workers):
+        tasks.put(None)
+
+
+# Seconds waited for a result before checking that the workers are still running
+RESULT_TIMEOUT = 1
+
+
+def replay_stream(lines: Iterable[str], processes: int | None = None, queue_size=64) -> Iterator[ReplayResult]:
+    """Replays every game of a PGN stream, using several processes.
+    The games are read as they are needed: at most `queue_size` games wait to be replayed,
+    and at most `queue_size` results wait to be read. The results finished before the previous
+    games are held until these are, to be yielded in order.
+
+    Args:
+        lines (Iterable[str]): The PGN lines (as an opened file)
+        processes (int | None, optional): The number of processes. Defaults to the number of CPUs.
+        queue_size (int, optional): The size of the games and results queues. Defaults to 64.
+
+    Returns:
+        Iterator[ReplayResult]: The results, in the order of the games in the stream
+    """
+    if processes == 1:
+        for (index, text) in enumerate(split_games(lines)):
+            yield replay(PGNGame.parse(text), index)
+        return
+
+    processes = processes or cpu_count()
+    tasks: Queue = Queue(queue_size)
+    results: Queue = Queue(queue_size)
+
+    workers = [
+        Process(target=_replay_worker, args=(tasks, results), daemon=True)
+        for _ in range(processes)
+    ]
+    for worker in workers:
+        worker.start()
+    Thread(target=_feed, args=(lines, tasks, processes), daemon=True).start()
+
+    # Results by game index, until the games before them are replayed
+    pending: dict[int, ReplayResult] = {}
+    expected = 0
+    try:
+        finished = 0
+        while finished < processes:
+            try:
+                result = results.get(timeout=RESULT_TIMEOUT)
+            except Empty:
+                # A worker killed without sending its end (out of memory, signal...) is not waited for
+                if any(worker.is_alive() for worker in workers):
+                    continue
+                # The games it was replaying are lost: the others are still given
+                for index in sorted(pending):
+                    yield pending.pop(index)
+                killed = [worker.exitcode for worker in workers if worker.exitcode]
+                assert not killed, f"{len(killed)} processus arrêtés avant la fin (codes : {killed})"
+                return
+
+            if result is None:
+                finished += 1
+                continue
+
+            pending[result.index] = result
+            while expected in pending:
+                yield pending.pop(expected)
+                expected += 1
+    finally:
+        for worker in workers:
+            if worker.is_alive():
+                worker.terminate()
+
+
+def run(args: list[str]):
+    """Command line entry: `--pgn <file> [--processes <count>]`
+    Replays the games of the file, printing the result of each one, then the replay speed.
+    """
+    assert args, "Usage : --pgn <fichier> [--processes <nombre>]"
+    from chess.cli import option
+
+    processes, args = option(args, "--processes")
+
+    games = moves = errors = 0
+    start = perf_counter()
+    with open(args[0], encoding="utf-8", errors="replace") as file:
+        for result in replay_stream(file, None if processes is None else int(processes)):
+            print(result)
+            games += 1
+            moves += result.moves
+            errors += result.error is not None
+
+    duration = perf_counter() - start
+    print(
+        f"\n{games} parties ({errors} en erreur), {moves} coups en {duration:.2f}s :",
+        f"{games / duration:.1f} parties/s, {moves / duration:.0f} coups/s"
+    )
@@ -1,4 +1,5 @@
-from re import search as reg_exec, IGNORECASE as REG_I
+from functools import lru_cache
+from re import compile as reg_compile, IGNORECASE as REG_I, Match
 from typing import TYPE_CHECKING, Literal
 from chess.movement.movement import Movement
 from chess.players._player import StatusVerifier
@@ -10,8 +11,18 @@ if TYPE_CHECKING:
     from chess.players._player import Player
 
 
+MOVE_PATTERN = reg_compile(Movement.MOVE_REGEX, REG_I)
+
+
 class BoardMovement(Movement):
 
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def parse(move: str) -> Match[str] | None:
+        """Parse the algebric movement notation (the results are cached)
+        """
+        return MOVE_PATTERN.search(move)
+
     @staticmethod
     def decode(move: str, board: 'Board', player: 'Player') -> 'Literal[False]|Movement':
         """Get the movement from the algebric movement notation
@@ -25,8 +36,9 @@ class BoardMovement(Movement):
             ValueError: If the player is not in the game
         """
         from chess.pieces.king import CastlingDirection, King
+        from chess.pieces.pawn import Pawn
 
-        move_info = reg_exec(Movement.MOVE_REGEX, move, REG_I)
+        move_info = BoardMovement.parse(move)
         if move_info is None:
             return False
 
@@ -41,38 +53,70 @@ class BoardMovement(Movement):
             'to', 'piece', 'from_col', 'from_row'
         )
 
-        from chess.pieces.pawn import Pawn
         to_position = Position.validate(board, to)
-        found: Movement | Literal[False] = False
+        notation = piece.lower() if piece else Pawn.NOTATION
 
-        for player_piece in board.pieces.of(player):
-            movement = Movement(player_piece.position, to_position)
+        origins = []
+        if piece == 'b' and not from_col:
+            # As in the standard notation, a lower case "b" is first read as the column of a pawn ("bxc3")
+            origins = BoardMovement.__origins(board, player, to_position, Pawn.NOTATION, 'b', from_row)
+        if not origins:
+            origins = BoardMovement.__origins(board, player, to_position, notation, from_col, from_row)
 
-            if piece and piece.lower() != player_piece.NOTATION.lower():
-                continue
+        if len(origins) != 1:
+            return False
+        found = Movement(origins[0].position, to_position)
 
-            if not (piece or isinstance(player_piece, Pawn)):
-                continue
+        if notation == King.NOTATION:
+            castling = King.castle_type(found)
+            if castling is not None:
+                return king.get_castle_movement(castling) or False
 
-            if from_col and player_piece.position.x != from_col:
-                continue
+        return found
 
-            if from_row and player_piece.position.y != from_row:
-                continue
+    @staticmethod
+    def __origins(board: 'Board', player: 'Player', to_position: Position, notation: str, from_col: str | None, from_row: str | None):
+        """Get the pieces of the given notation that can legally move to the position (stops at the second one found)
+        """
+        from chess.pieces.king import King
+        from chess.pieces.pawn import Pawn
 
-            if not (movement.to_position in player_piece.contesting_positions() and player_piece._is_movement_legal(movement.in_board(board))):
+        # The squares the piece may come from
+        geometry = board.geometry
+        origins = geometry.full
+        if from_col:
+            origins &= geometry.files[board.X_RANGE.index(from_col)] \
+                if from_col in board.X_RANGE else 0
+        if from_row:
+            origins &= geometry.ranks[board.Y_RANGE.index(int(from_row))] \
+                if int(from_row) in board.Y_RANGE else 0
+
+        found: list['Piece'] = []
+        for (side, kind), mask in board.bitboards.pieces.items():
+            if side != player.direction or kind.NOTATION.lower() != notation:
                 continue
 
-            if found:
-                return False
-            found = movement
+            candidates = mask & origins
 
-        if found and piece and isinstance(piece, King):
-            castling = piece.castle_type(found)
-            if castling is not None:
-                return BoardMovement.decode("0-0" + (
-                    "-0" if castling == 'queen' else ""
-                ), board, player)
+            # Kings may also castle
+            attackers = None if issubclass(kind, King) else kind.attackers_mask(
+                geometry, to_position.square, board.bitboards.all, side
+            )
+            if attackers is not None:
+                if issubclass(kind, Pawn):
+                    # Pawns may also be pushed along their column
+                    attackers |= geometry.files[to_position.x_index]
+                candidates &= attackers
+
+            for square in geometry.squares(candidates):
+                player_piece = board._occupancy_at(square)
+                assert player_piece is not None, "Bitboards are out of sync."
+                if not player_piece.can_move_to(to_position):
+                    continue
+
+                found.append(player_piece)
+                if len(found) > 1:
+                    return found
 
         return found
 
@@ -85,7 +129,7 @@ class BoardMovement(Movement):
         if isinstance(positions, Movement):
             self.__dict__.update(positions.__dict__)
             if self.cascade:
-                self.cascading(self.cascade.in_board(board))
+                self.cascading(BoardMovement(self.cascade, board, self))
         else:
             super().__init__(positions[0], positions[1])
 
@@ -95,12 +139,18 @@ class BoardMovement(Movement):
         self.validated_as: 'Piece | None' = None
         self.__board_hash_after: int | None = None
 
-        self.__player_consequences: None | StatusVerifier = None
-        self.__opponent_consequences: None | StatusVerifier = None
+        # Filled when first read (see `consequences`)
+        self.__consequences: dict[str, StatusVerifier] = {}
 
     def __str__(self) -> str:
         return self._computed_notation or super().__str__()
 
+    @property
+    def san(self):
+        """The standard algebraic notation of the saved movement (with pieces letters), as used in PGN files
+        """
+        return self._computed_san
+
     def __identifier__(self):
         return (
             f"{self.validated_as.NOTATION}: " if self.validated_as else ""
@@ -112,41 +162,79 @@ class BoardMovement(Movement):
         return super().in_board(board)
 
     def consequences(self, of: Literal['player', 'opponent']):
-        return self.__player_consequences if of == "player" else self.__opponent_consequences
+        """Get the status of the player (or its opponent) once the movement has been made.
+        The status is computed when first read, on the current position of the board.
+
+        Returns:
+            StatusVerifier | None: The status, or None if the movement has not been validated
+        """
+        if self.validated_as is None:
+            return None
+
+        status = self.__consequences.get(of)
+        if status is None:
+            player = self.validated_as.player
+            status = self.__consequences[of] = self.board.status_of(
+                player if of == "player" else player.opponent_in(self.board)
+            )
+        return status
 
     def validate(self, and_save=False):
         assert self.__board_hash_after is None, "The movement has already been validated."
-        piece = self.board.pieces.at(self.from_position).first()
+        piece = self.board._occupancy_at(
+            self.board.geometry.square_of(self.from_position)
+        )
         assert piece is not None, "Cannot validate the movement: no piece at the start position"
 
-        piece.move(self)
+        if self.depends_on is None:
+            self.board._movement_started()
 
-        self.__board_hash_after = hash(self.board)
+        # The other pieces able to make the same movement are looked for before it is made
+        use_helpers = self.__origin_helpers(piece) if and_save else None
+
+        piece.move(self)
 
         if self.cascade:
             self.cascade.in_board(self.board).validate(False)
 
+        # Cascading movements are part of their parent's turn
+        if self.depends_on is None:
+            from chess.pieces.pawn import Pawn
+            self.board._pass_turn()
+
+            en_passant = None
+            if isinstance(piece, Pawn) and self.distance == (0, 2):
+                geometry = self.board.geometry
+                en_passant = geometry.positions[(
+                    geometry.square_of(self.from_position)
+                    + geometry.square_of(self.to_position)
+                ) // 2]
+            self.board._movement_made(
+                bool(self.with_piece_eaten) or isinstance(piece, Pawn),
+                en_passant
+            )
+
+        self.__board_hash_after = hash(self.board)
+
         self.validated_as = piece
-        if and_save:
-            self.__compute_notation()
+        if use_helpers is not None:
+            self.__compute_notation(use_helpers)
             self.board.moves.insert(self)
 
-        self.__player_consequences = piece.player.verify_status(
-            self.board)
-        self.__opponent_consequences = piece.player.opponent_in(
-            self.board
-        ).verify_status(self.board)
-
         return True
 
     def unvalidate(self, force=False):
-        if self.cascade:
-            self.cascade.in_board(self.board).unvalidate()
-
         assert hash(
             self.board
         ) == self.__board_hash_after, "The movement can't be unvalidated because the board is not at the right position."
 
+        if self.depends_on is None:
+            self.board._movement_canceled()
+            self.board._pass_turn()
+
+        if self.cascade:
+            self.cascade.in_board(self.board).unvalidate()
+
         piece = self.validated_as or (
             # pylint: disable=unsubscriptable-object
             self.with_promotion[0] if self.with_promotion else self.board.pieces.at(
@@ -159,18 +247,56 @@ class BoardMovement(Movement):
 
         self.__board_hash_after =\
             self._computed_notation =\
-            self.__player_consequences =\
-            self.__opponent_consequences =\
+            self._computed_san =\
             self.validated_as =\
             None
+        self.__consequences = {}
 
         return True
 
-    def __compute_notation(self):
+    def __origin_helpers(self, piece: 'Piece') -> tuple[bool, bool]:
+        """Get the start coordinates (x, y) the notation needs to tell the piece apart from the other pieces of its type.
+        This method must be called **BEFORE** the movement is made.
+        """
+        from chess.pieces.pawn import Pawn
+
+        board = self.board
+        to_square = board.geometry.square_of(self.to_position)
+        if isinstance(piece, Pawn):
+            # Pawns captures start with their column
+            return board._occupancy_at(to_square) is not None, False
+
+        kind = type(piece)
+        others = board.bitboards.pieces.get(
+            (piece.player.direction, kind), 0
+        ) & ~board.bitboards.bit(piece)
+        attackers = kind.attackers_mask(
+            board.geometry, to_square, board.bitboards.all, piece.player.direction
+        )
+        if attackers is not None:
+            others &= attackers
+
+        rivals = [
+            other.position for other in map(board._occupancy_at, board.geometry.squares(others))
+            if other is not None and other.can_move_to(self.to_position)
+        ]
+        if not rivals:
+            return False, False
+
+        if all(rival.x != piece.position.x for rival in rivals):
+            return True, False
+        if all(rival.y != piece.position.y for rival in rivals):
+            return False, True
+        return True, True
+
+    def __compute_notation(self, use_helpers: tuple[bool, bool]):
         """
               Compute the generated movement in the __computed_notation property.
               This method must be called **AFTER** the movement has been fully made.
               Warning: call this method only once : the computed notation will be relative to the board current pieces positions
+
+              Args:
+                use_helpers (tuple[bool, bool]): If the start column and row must be written (see `__origin_helpers`)
         """
         assert hash(
             self.board
@@ -179,53 +305,41 @@ class BoardMovement(Movement):
         piece = self.validated_as
         assert piece is not None, "Cannot compute notation : movement has not been validated."
 
-        if self.with_castling is not None:
-            self._computed_notation = "0-0" + (
-                "-0" if self.with_castling == 'queen' else ""
-            )
-            return
-
-        piece.ghost = True
-
-        # (x, y)
-        use_helpers = [False, False]
-
-        for other_piece in self.board.pieces.of(piece.player).type(type(piece)).exept(piece):
-            if self.to_position in [m.to_position for m in other_piece.legal_movements()]:
-                use_helpers[0] = (
-                    piece.position.y == other_piece.position.y
-                ) or use_helpers[0]
-
-                use_helpers[1] = (
-                    piece.position.x == other_piece.position.x
-                ) or use_helpers[1]
-
-            if use_helpers[0] and use_helpers[1]:
-                break
-
-        piece.ghost = False
-
+        from chess.pieces.king import CastlingDirection
         from chess.pieces.pawn import Pawn
 
-        self._computed_notation = (
-            "" if isinstance(piece, Pawn) else f"{piece} "
-        ) + (
-            self.from_position.x if use_helpers[0] else ""
-        ) + (
-            self.from_position.y if use_helpers[1] else ""
-        ) + (
-            "x" if self.with_piece_eaten else ""
-        ) + (
-            str(self.to_position)
-        ) + (
+        if self.with_castling is not None:
+            castling = "-0" if self.with_castling == CastlingDirection.QUEEN else ""
+            notation = "0-0" + castling
+            san = ("0-0" + castling).replace("0", "O")
+        else:
+            target = (
+                self.from_position.x if use_helpers[0] else ""
+            ) + (
+                self.from_position.y if use_helpers[1] else ""
+            ) + (
+                "x" if self.with_piece_eaten else ""
+            ) + (
+                str(self.to_position)
+            )
             # pylint: disable=unsubscriptable-object
-            self.with_promotion[1].NOTATION.upper()
-            if self.with_promotion else ""
-        ) + (
-            (
-                # todo
-                # ? This will never be computed
-                "#" if self.__opponent_consequences.is_check_mate else
-                "+" if self.__opponent_consequences.is_checked else ""
-            ) if self.__opponent_consequences else ""
-        )
+            promotion = self.with_promotion[1].NOTATION.upper() if self.with_promotion else ""
+
+            notation = (
+                "" if isinstance(piece, Pawn) else f"{piece} "
+            ) + target + promotion
+            san = (
+                "" if isinstance(piece, Pawn) else piece.NOTATION.upper()
+            ) + target + (f"={promotion}" if promotion else "")
+
+        suffix = ""
+        if self.board._king_of(-piece.player.direction) is not None:
+            status = self.consequences('opponent')
+            assert status is not None
+            suffix = (
+                "#" if status.with_checkmate().is_check_mate else
+                "+" if status.is_checked else ""
+            )
+
+        self._computed_notation = notation + suffix
+        self._computed_san = san + suffix
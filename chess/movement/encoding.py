@@ -0,0 +1,83 @@
+"""Compact encoding of the movements in 16 bits, to store games
+
+    bits 0-5    starting square
+    bits 6-11   reached square
+    bits 12-13  promotion (knight, bishop, rook, queen)
+    bits 14-15  flags (see `FLAG_*`)
+"""
+
+from typing import TYPE_CHECKING
+from chess.movement.movement import Movement
+
+if TYPE_CHECKING:
+    from chess.boards.board import Board
+    from chess.pieces._piece import Piece
+
+FLAG_NORMAL = 0
+FLAG_PROMOTION = 1
+FLAG_CASTLING = 2
+# "En passant" captures are not played in this game, their flag is kept for the format
+FLAG_EN_PASSANT = 3
+
+SQUARE_BITS = 6
+SQUARE_MASK = (1 << SQUARE_BITS) - 1
+
+
+def promotion_types() -> 'tuple[type[Piece], ...]':
+    """The pieces a pawn can be promoted as, ordered by their code"""
+    from chess.pieces.bishop import Bishop
+    from chess.pieces.knight import Knight
+    from chess.pieces.queen import Queen
+    from chess.pieces.rook import Rook
+    return (Knight, Bishop, Rook, Queen)
+
+
+def encode_move(movement: Movement, promote_as: 'type[Piece] | None' = None) -> int:
+    """Get the 16 bits code of the movement.
+    The promotion and castling are read from the movement once played, or can be given beforehand.
+
+    Args:
+        movement (Movement): The movement, in a board of at most 64 squares
+        promote_as (type[Piece] | None, optional): The piece the pawn is promoted as. Defaults to None.
+    """
+    from_position, to_position = movement.from_position, movement.to_position
+    assert from_position.geometry is not None and to_position.geometry is not None, \
+        "Positions have not been validated in board"
+    assert from_position.geometry.size <= 1 << SQUARE_BITS, "The board has too many squares to be encoded."
+
+    if promote_as is None and movement.with_promotion is not None:
+        promote_as = type(movement.with_promotion[1])
+
+    code = from_position.square | to_position.square << SQUARE_BITS
+    if promote_as is not None:
+        code |= promotion_types().index(promote_as) << 12 | FLAG_PROMOTION << 14
+    elif movement.with_castling is not None or movement.cascade is not None:
+        code |= FLAG_CASTLING << 14
+    return code
+
+
+def decode_move(code: int, board: 'Board') -> 'tuple[Movement, type[Piece] | None]':
+    """Get the movement of the 16 bits code in the current position of the board,
+    with the piece the pawn is promoted as (None if it is not a promotion).
+    """
+    from chess.pieces.king import King
+
+    from_position = board.position_of(code & SQUARE_MASK)
+    to_position = board.position_of(code >> SQUARE_BITS & SQUARE_MASK)
+    movement = Movement(from_position, to_position)
+
+    flags = code >> 14
+    if flags == FLAG_PROMOTION:
+        return movement, promotion_types()[code >> 12 & 3]
+
+    if flags == FLAG_CASTLING:
+        king = board._occupancy_at(from_position.square)
+        castling = King.castle_type(movement)
+        assert isinstance(king, King) and castling is not None, "Invalid castling code."
+
+        castle_movement = king.get_castle_movement(castling)
+        assert castle_movement is not None, "The king cannot castle."
+        return castle_movement, None
+
+    assert flags == FLAG_NORMAL, "Invalid movement code."
+    return movement, None
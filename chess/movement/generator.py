@@ -0,0 +1,159 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from chess.boards.board import Board
+    from chess.movement.board_movement import BoardMovement
+    from chess.pieces._piece import Piece
+
+
+class LegalMoveGenerator:
+    """Legal movements of a player, in the current position of a board.
+
+    The pieces checking the king and the pinned pieces are computed once.
+    The legal targets of a piece are then its contesting squares filtered
+    with masks, without making the movements on the board.
+
+    Use `Board.legal_moves` to get the (cached) generator of a position.
+    As it is shared by the identical positions, it only keeps squares, not pieces.
+    """
+
+    def __init__(self, board: 'Board', direction: int) -> None:
+        king = board._king_of(direction)
+        assert king is not None, "The player has no king."
+
+        self.board = board
+        self.direction = direction
+
+        geometry = board.geometry
+        bitboards = board.bitboards
+        king_square = self.king_square = king.position.square
+        own = bitboards.of(direction)
+        occupied = bitboards.all
+
+        self.checkers = board.attackers(king_square, -direction)
+
+        # Kings cannot be eaten
+        from chess.pieces.king import King
+        self.uncapturable = 0
+        for (side, kind), mask in bitboards.pieces.items():
+            if side != direction and issubclass(kind, King):
+                self.uncapturable |= mask
+
+        # Squares the other pieces can move to, so that the king is no longer checked
+        self.check_mask = geometry.full
+        if self.checkers & (self.checkers - 1):
+            self.check_mask = 0
+        elif self.checkers:
+            checker_square = self.checkers.bit_length() - 1
+            checker = board._occupancy_at(checker_square)
+            assert checker is not None, "Bitboards are out of sync."
+
+            self.check_mask = self.checkers
+            for (dx, dy) in checker.RAYS:
+                line = geometry.rays(-dx, -dy)[king_square]
+                if line & self.checkers:
+                    self.check_mask = line & ~geometry.rays(
+                        -dx, -dy
+                    )[checker_square]
+                    break
+
+        # Pinned piece square -> squares it can move to without leaving the pin line
+        self.pins: dict[int, int] = {}
+        for (side, kind), mask in bitboards.pieces.items():
+            if side == direction or not mask:
+                continue
+
+            for (dx, dy) in kind.RAYS:
+                # Looking from the king towards the sliding pieces
+                rays = geometry.rays(-dx, -dy)
+                line = rays[king_square]
+                if not line & mask:
+                    continue
+
+                pinned = geometry.nearest(line & occupied, -dx, -dy)
+                if not own & (1 << pinned):
+                    continue
+
+                beyond = rays[pinned] & occupied
+                if not beyond:
+                    continue
+
+                pinner = geometry.nearest(beyond, -dx, -dy)
+                if mask & (1 << pinner):
+                    self.pins[pinned] = line & ~rays[pinner]
+
+        # Square -> legal targets of the piece on it
+        self.__targets: dict[int, int] = {}
+
+    @staticmethod
+    def supports(board: 'Board', direction: int):
+        """Tests if the legal movements of the player can be generated without making them.
+        This requires a king, and opponent pieces describing their movement pattern.
+        """
+        if board._king_of(direction) is None:
+            return False
+
+        for (side, kind), mask in board.bitboards.pieces.items():
+            if side != direction and mask and not kind.has_pattern():
+                return False
+        return True
+
+    def targets(self, piece: 'Piece') -> int:
+        """Get the mask of the squares the piece can legally move to (castling excluded)
+        """
+        if not piece.playable:
+            return 0
+
+        square = piece.position.square
+        targets = self.__targets.get(square)
+        if targets is None:
+            targets = self.__targets[square] = self.__compute_targets(
+                piece, square
+            )
+        return targets
+
+    def __compute_targets(self, piece: 'Piece', square: int):
+        if square == self.king_square:
+            return self.__king_targets(piece)
+
+        targets = piece.contesting_mask() & self.check_mask & ~self.uncapturable
+        pin = self.pins.get(square)
+        if pin is not None:
+            targets &= pin
+        return targets
+
+    def __king_targets(self, king: 'Piece'):
+        # The king does not protect the squares behind it
+        occupied = self.board.bitboards.all & ~(1 << self.king_square)
+
+        targets = 0
+        for square in self.board.geometry.squares(
+            king.contesting_mask() & ~self.uncapturable
+        ):
+            if not self.board.attackers(square, -self.direction, occupied):
+                targets |= 1 << square
+        return targets
+
+
+def movements_of(board: 'Board'):
+    """Get the legal movements of the player whose turn it is.
+    Promotions are listed once per piece the pawn can be promoted as: (movement, piece type or None)
+    """
+    from chess.pieces.pawn import Pawn
+
+    for movement in list(board.iter_legal_movements(board.turn)):
+        movement = movement.in_board(board)
+        piece = board._occupancy_at(movement.from_position.square)
+        if isinstance(piece, Pawn) and piece.require_promotion(movement):
+            for (_, promote_as) in Pawn.PROMOTABLE_AS:
+                yield movement, promote_as
+        else:
+            yield movement, None
+
+
+def movement_name(movement: 'BoardMovement', promote_as: 'type[Piece] | None'):
+    """Get the name of the movement as start and end cases, followed by the promotion (as "e7e8q")
+    """
+    return f"{movement.from_position}{movement.to_position}" + (
+        promote_as.NOTATION if promote_as else ""
+    )
@@ -16,6 +16,7 @@ class Movement:
         self.from_position = from_position.clone()
         self.to_position = to_position.clone()
         self._computed_notation: str | None = None
+        self._computed_san: str | None = None
 
         self.__cascade_with: Movement | None = None
         self.with_piece_eaten: 'Piece|None' = None
@@ -78,74 +79,79 @@ class Movement:
 class MovementBuilder:
     """Move a position
 
+    The builder works on the x/y indexes of the position's geometry:
+    the `safe_*` methods and `square` return None for off-board targets
+    instead of raising.
+
     Warning :   in order to use this class, the given init position
                 must have been validated in a board.
     """
 
     def __init__(self, init_position: Position) -> None:
+        assert init_position.geometry is not None, "Position has not been validated in board"
         self.__init = init_position
-        self.__xy = -1, -1
+        self.__geometry = init_position.geometry
+        self.__x = self.__y = -1
         self.reset()
 
     def reset(self):
-        self.__xy = self.__init.x_index, self.__init.y_index
+        self.__x, self.__y = self.__init.x_index, self.__init.y_index
         return self
 
+    def square(self) -> int | None:
+        """Get the square number of the current target, or None if it is off the board
+        """
+        if 0 <= self.__x < self.__geometry.width and 0 <= self.__y < self.__geometry.height:
+            return self.__y * self.__geometry.width + self.__x
+        return None
+
     def position(self):
-        assert 0 <= self.__xy[0] < len(
-            self.__init.board.X_RANGE
-        ), "Movement overflow on x"
-        assert 0 <= self.__xy[1] < len(
-            self.__init.board.Y_RANGE
-        ), "Movement overflow on y"
-
-        return Position.validate(
-            self.__init.board,
-            self.__init.board.X_RANGE[self.__xy[0]],
-            self.__init.board.Y_RANGE[self.__xy[1]],
-        )
+        assert 0 <= self.__x < self.__geometry.width, "Movement overflow on x"
+        assert 0 <= self.__y < self.__geometry.height, "Movement overflow on y"
+
+        return self.__geometry.positions[self.__y * self.__geometry.width + self.__x]
 
     def safe_position(self):
-        try:
-            return self.position()
-        except AssertionError:
-            return None
+        square = self.square()
+        return None if square is None else self.__geometry.positions[square]
 
     def movement(self):
         return Movement(self.__init, self.position())
 
     def safe_movement(self):
-        try:
-            return self.movement()
-        except AssertionError:
-            return None
+        position = self.safe_position()
+        return None if position is None else Movement(self.__init, position)
 
     def setX(self, x: str):
-        self.__xy = self.__init.board.X_RANGE.index(x), self.__xy[1]
+        self.__x = self.__geometry.X_RANGE.index(x)
         return self
 
     def setY(self, y: int):
-        self.__xy = self.__xy[0], self.__init.board.Y_RANGE.index(y)
+        self.__y = self.__geometry.Y_RANGE.index(y)
         return self
 
     def addX(self, add: int, direction: int = 1):
-        self.__xy = self.__xy[0] + add * direction, self.__xy[1]
+        self.__x += add * direction
         return self
 
     def addY(self, add: int, direction: int = 1):
-        self.__xy = self.__xy[0], self.__xy[1] + add * direction
+        self.__y += add * direction
         return self
 
     def addXY(self, x: int, y: int, directions: int | tuple[int, int] = 1):
-        dx, dy = directions if isinstance(
-            directions, tuple) else (directions, directions)
-        self.addX(x, dx)
-        self.addY(y, dy)
+        if isinstance(directions, tuple):
+            self.__x += x * directions[0]
+            self.__y += y * directions[1]
+        else:
+            self.__x += x * directions
+            self.__y += y * directions
         return self
 
     def to(self, position: Position | str):
         if isinstance(position, str):
-            position = Position.validate(self.__init.board, position)
-        self.__xy = position.x_index, position.y_index
+            found = self.__geometry.position(*Position(position).raw_xy)
+            assert found is not None, "Invalid position"
+            position = found
+        self.__x, self.__y = position.x_index, position.y_index
 
         return self
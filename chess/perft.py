@@ -0,0 +1,268 @@
+"""Counts the movements paths of a position (perft), to test and measure the legal movements generation"""
+
+from multiprocessing import Pool
+from time import perf_counter
+from typing import TYPE_CHECKING
+from chess.cli import option, setup_game
+from chess.movement.generator import movement_name, movements_of
+
+if TYPE_CHECKING:
+    from chess.boards.board import Board
+    from chess.pieces._piece import Piece
+
+# (board type, player to play, pieces as (type, player direction, square, has moved))
+EncodedPosition = tuple[
+    type['Board'], int, tuple[tuple[type['Piece'], int, int, bool], ...]
+]
+
+
+class PerftResult:
+    FIELDS = ("nodes", "captures", "castles", "promotions", "checks", "checkmates")
+
+    def __init__(self, nodes=0, captures=0, castles=0, promotions=0, checks=0, checkmates=0) -> None:
+        self.nodes = nodes
+        self.captures = captures
+        self.castles = castles
+        self.promotions = promotions
+        self.checks = checks
+        self.checkmates = checkmates
+
+    def as_tuple(self):
+        return tuple(getattr(self, field) for field in self.FIELDS)
+
+    def __iadd__(self, other: 'PerftResult'):
+        for field in self.FIELDS:
+            setattr(self, field, getattr(self, field) + getattr(other, field))
+        return self
+
+    def __eq__(self, value: object) -> bool:
+        return isinstance(value, PerftResult) and value.as_tuple() == self.as_tuple()
+
+    def __str__(self) -> str:
+        return (
+            f"{self.nodes} noeuds (prises: {self.captures}, roques: {self.castles}, "
+            f"promotions: {self.promotions}, échecs: {self.checks}, mats: {self.checkmates})"
+        )
+
+
+# Known results from the normal start position, indexed by depth
+# (from the 5th depth, they include "en passant" captures, which this game does not play)
+START_POSITION_RESULTS = {
+    1: PerftResult(20),
+    2: PerftResult(400),
+    3: PerftResult(8902, captures=34, checks=12),
+    4: PerftResult(197281, captures=1576, checks=469, checkmates=8),
+    5: PerftResult(4865609, captures=82719, checks=27351, checkmates=347),
+    6: PerftResult(119060324, captures=2812008, checks=809099, checkmates=10828),
+}
+
+
+def perft(board: 'Board', depth: int, breakdown=True) -> PerftResult:
+    """Counts the movements paths of the given depth, from the current position of the board
+
+    Args:
+        board (Board): The board (its position is restored once done)
+        depth (int): The number of movements of the paths
+        breakdown (bool, optional): If the last movements are made to count their captures, castles, promotions and checks. Defaults to True.
+    """
+    from chess.pieces.pawn import Pawn
+
+    result = PerftResult()
+    if depth <= 0:
+        result.nodes = 1
+        return result
+
+    for (movement, promote_as) in movements_of(board):
+        if depth == 1 and not breakdown:
+            result.nodes += 1
+            continue
+
+        pawn = board._occupancy_at(movement.from_position.square)
+        if promote_as is not None:
+            assert isinstance(pawn, Pawn)
+            forced = pawn.forced_promotion
+            pawn.force_promotion_as(promote_as)
+
+        movement.validate()
+        if depth == 1:
+            result += _leaf(board, movement)
+        else:
+            result += perft(board, depth - 1, breakdown)
+        movement.unvalidate()
+
+        if promote_as is not None:
+            assert isinstance(pawn, Pawn)
+            pawn.force_promotion_as(forced or "ask")
+
+    return result
+
+
+def _leaf(board: 'Board', movement) -> PerftResult:
+    king = board._king_of(board.turn)
+    checked = king is not None and board.is_attacked(king.position.square, -board.turn)
+
+    return PerftResult(
+        nodes=1,
+        captures=int(movement.with_piece_eaten is not None),
+        castles=int(movement.with_castling is not None),
+        promotions=int(movement.with_promotion is not None),
+        checks=int(checked),
+        checkmates=int(
+            checked and next(board.iter_legal_movements(board.turn), None) is None
+        ),
+    )
+
+
+def encode_position(board: 'Board') -> EncodedPosition:
+    """Get a compact (and picklable) encoding of the board's position, to rebuild it in another process
+    """
+    from chess.pieces._piece import WithMovementObserver
+
+    return type(board), board.turn, tuple(
+        (
+            type(piece), piece.player.direction, piece.position.square,
+            isinstance(piece, WithMovementObserver) and piece.has_moved
+        )
+        for piece in board.pieces
+    )
+
+
+def decode_position(position: EncodedPosition) -> 'Board':
+    """Rebuilds a board from its encoded position (see `encode_position`)
+    """
+    from chess.pieces._piece import WithMovementObserver
+    from chess.players._player import Player
+
+    board_type, turn, pieces = position
+    board = board_type()
+    players = {
+        direction: Player(direction)  # type: ignore
+        for direction in (Player.WHITES_DIRECTION, Player.BLACKS_DIRECTION)
+    }
+
+    for (piece_type, direction, square, has_moved) in pieces:
+        x, y = board.position_of(square).raw_xy
+        piece = piece_type(board, players[direction], x, y)  # type: ignore
+        if has_moved and isinstance(piece, WithMovementObserver):
+            piece.mark_as_moved()
+
+    board.turn = turn
+    return board
+
+
+# Board rebuilt once by each process of the divide pool
+_worker_board: 'Board | None' = None
+
+
+def _init_worker(position: EncodedPosition):
+    global _worker_board
+    _worker_board = decode_position(position)
+
+
+def _divide_one(task: tuple[str, int, bool]):
+    name, depth, breakdown = task
+    board = _worker_board
+    assert board is not None, "The process has not been initialized."
+
+    from chess.pieces.pawn import Pawn
+
+    for (movement, promote_as) in movements_of(board):
+        if movement_name(movement, promote_as) != name:
+            continue
+
+        pawn = board._occupancy_at(movement.from_position.square)
+        if promote_as is not None:
+            assert isinstance(pawn, Pawn)
+            pawn.force_promotion_as(promote_as)
+
+        movement.validate()
+        result = _leaf(board, movement) if depth == 1 else perft(
+            board, depth - 1, breakdown
+        )
+        movement.unvalidate()
+        return name, result
+
+    raise LookupError(f"The movement {name} is not legal in this position.")
+
+
+def divide(board: 'Board', depth: int, processes: int | None = None, breakdown=True) -> dict[str, PerftResult]:
+    """Counts the movements paths of the given depth, for each first movement.
+    The first movements are shared between processes, each one rebuilding the position.
+
+    Args:
+        board (Board): The board
+        depth (int): The number of movements of the paths (at least 1)
+        processes (int | None, optional): The number of processes. Defaults to the number of CPUs.
+        breakdown (bool, optional): See `perft`. Defaults to True.
+
+    Returns:
+        dict[str, PerftResult]: The results by first movement name (see `movement_name`), sorted by name
+    """
+    assert depth >= 1, "The depth must be at least 1."
+
+    tasks = sorted(
+        (movement_name(movement, promote_as), depth, breakdown)
+        for (movement, promote_as) in movements_of(board)
+    )
+
+    with Pool(processes, _init_worker, (encode_position(board),)) as pool:
+        results = dict(pool.imap_unordered(_divide_one, tasks))
+
+    return {name: results[name] for (name, _, _) in tasks}
+
+
+def run(args: list[str]):
+    """Command line entry: `--perft <depth> [--fen <fen>] [movements...]`
+    Counts the paths of each depth up to the given one, from the start (or FEN) position or after the given movements.
+    """
+    assert args and args[0].isdigit(), "Usage : --perft <profondeur> [--fen <fen>] [mouvements...]"
+    depth = int(args[0])
+
+    game, from_start = setup_game(args[1:])
+    for current_depth in range(1, depth + 1):
+        start = perf_counter()
+        result = perft(game.board, current_depth)
+        duration = perf_counter() - start
+
+        expected = START_POSITION_RESULTS.get(current_depth) if from_start else None
+        print(
+            f"Profondeur {current_depth} : {result}",
+            f"- {duration:.2f}s, {result.nodes / duration:.0f} noeuds/s",
+            "" if expected is None else "✓" if expected == result else f"✗ (attendu : {expected})"
+        )
+
+
+def run_divide(args: list[str]):
+    """Command line entry: `--divide <depth> [--processes <count>] [--fen <fen>] [movements...]`
+    Counts the paths of the given depth for each first movement, using several processes,
+    then counts them again in this process to compare the durations.
+    """
+    assert args and args[0].isdigit(), "Usage : --divide <profondeur> [--processes <nombre>] [--fen <fen>] [mouvements...]"
+    depth = int(args[0])
+
+    processes, args = option(args[1:], "--processes")
+    processes = int(processes) if processes else None
+
+    game, _ = setup_game(args)
+
+    start = perf_counter()
+    results = divide(game.board, depth, processes)
+    duration = perf_counter() - start
+
+    total = PerftResult()
+    for (name, result) in results.items():
+        print(f"{name} : {result.nodes}")
+        total += result
+
+    print(f"\nTotal : {total}")
+    print(f"{processes or 'Tous les'} processus : {duration:.2f}s, {total.nodes / duration:.0f} noeuds/s")
+
+    start = perf_counter()
+    baseline = perft(game.board, depth)
+    single_duration = perf_counter() - start
+    assert baseline == total, "The processes did not count the same paths."
+
+    print(
+        f"1 processus : {single_duration:.2f}s, {baseline.nodes / single_duration:.0f} noeuds/s",
+        f"(x{single_duration / duration:.1f})"
+    )
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator
 from chess.movement.movement import Movement
 from chess.players._player import Player
 from chess.position import Position
@@ -6,33 +6,156 @@ from chess.movement.board_movement import BoardMovement
 
 if TYPE_CHECKING:
     from chess.boards.board import Board
+    from chess.boards.geometry import Geometry
 
 
 class Piece:
     REPRESENTATION = (None, None)
     NOTATION = "!!UNDEFINED!!"
+    # Material value, in pawns
+    VALUE = 0
+
+    # Movement pattern of the piece, as (dx, dy) steps:
+    # leaps are made once, rays are repeated until a piece is met
+    LEAPS: tuple[tuple[int, int], ...] = ()
+    RAYS: tuple[tuple[int, int], ...] = ()
+
+    # True if the piece can only reach the squares of its starting square color
+    SQUARE_COLOR_BOUND = False
 
     def __init__(self, board: 'Board', player: Player, value: int, x: str, y: int | None = None) -> None:
         self.position = Position.validate(board, x, y)
-        assert not board.pieces.at(self.position).exist(
-        ), "There is already a piece at this position on this board."
+        assert board._occupancy_at(
+            self.position.square
+        ) is None, "There is already a piece at this position on this board."
 
-        self.eaten_by: Piece | None = None
-        self.ghost = False
+        self.__eaten_by: Piece | None = None
+        self.__ghost = False
         self.value = value
         self.player = player
         self.board = board
 
         board._pieces.append(self)
+        board._occupy(self)
 
     @property
     def playable(self):
         return not (self.eaten_by or self.ghost)
 
+    @property
+    def eaten_by(self):
+        return self.__eaten_by
+
+    @eaten_by.setter
+    def eaten_by(self, piece: 'Piece | None'):
+        was_playable = self.playable
+        self.__eaten_by = piece
+        self.__playable_changed(was_playable)
+
+    @property
+    def ghost(self):
+        return self.__ghost
+
+    @ghost.setter
+    def ghost(self, ghost: bool):
+        was_playable = self.playable
+        self.__ghost = ghost
+        self.__playable_changed(was_playable)
+
+    def __playable_changed(self, was_playable: bool):
+        """Keeps the board's occupancy in sync when the piece enters or leaves the game
+        """
+        if was_playable is self.playable:
+            return
+
+        if self.playable:
+            self.board._occupy(self)
+        else:
+            self.board._release(self)
+
+    @classmethod
+    def has_pattern(cls):
+        """Tests if the piece type describes its movement pattern (see `attacks_mask`)
+        """
+        return bool(cls.LEAPS or cls.RAYS)
+
+    @classmethod
+    def attacks_mask(cls, geometry: 'Geometry', pieces: int, empty: int, direction: int) -> int | None:
+        """Get the mask of the squares attacked by the pieces of this type
+
+        Args:
+            geometry (Geometry): The geometry of the board
+            pieces (int): The mask of the attacking pieces
+            empty (int): The mask of the empty squares (stopping the rays)
+            direction (int): The direction of the pieces' player
+
+        Returns:
+            int | None: The attacked squares, or None if the piece type does not describe its pattern
+        """
+        if not cls.has_pattern():
+            return None
+
+        attacks = 0
+        if cls.LEAPS:
+            leaps = geometry.leaps(cls.LEAPS)
+            for square in geometry.squares(pieces):
+                attacks |= leaps[square]
+
+        if cls.RAYS:
+            occupied = geometry.full & ~empty
+            for square in geometry.squares(pieces):
+                for (dx, dy) in cls.RAYS:
+                    attacks |= geometry.ray_attacks(square, dx, dy, occupied)
+
+        return attacks
+
+    @classmethod
+    def attackers_mask(cls, geometry: 'Geometry', square: int, occupied: int, direction: int) -> int | None:
+        """Get the mask of the squares from which a piece of this type would attack the square
+
+        Args:
+            geometry (Geometry): The geometry of the board
+            square (int): The attacked square
+            occupied (int): The mask of the occupied squares (stopping the rays)
+            direction (int): The direction of the attacking player
+
+        Returns:
+            int | None: The attacking squares, or None if the piece type does not describe its pattern
+        """
+        if not cls.has_pattern():
+            return None
+
+        attackers = 0
+        if cls.LEAPS:
+            attackers |= geometry.leaps_to(cls.LEAPS)[square]
+
+        for (dx, dy) in cls.RAYS:
+            attackers |= geometry.ray_attacks(square, -dx, -dy, occupied)
+
+        return attackers
+
+    def contesting_mask(self) -> int:
+        """Get the mask of the squares the piece is contesting
+        """
+        if not self.has_pattern():
+            mask = 0
+            for position in self.contesting_positions():
+                mask |= 1 << position.square
+            return mask
+
+        bitboards = self.board.bitboards
+        attacks = self.attacks_mask(
+            bitboards.geometry, bitboards.bit(self), bitboards.empty, self.player.direction
+        )
+        assert attacks is not None, "The piece does not describe its movement pattern."
+        return attacks & ~bitboards.of(self.player.direction)
+
     def contesting_positions(self) -> list[Position]:
         """Get the list of the positions the piece is contesting
         """
-        return []
+        if not self.has_pattern():
+            return []
+        return self.board.positions_of(self.contesting_mask())
 
     def _is_movement_legal(self, movement: 'BoardMovement'):
         if not (
@@ -40,6 +163,13 @@ class Piece:
         ):
             return False
 
+        generator = movement.board.legal_moves(self.player.direction)
+        if generator is not None:
+            return bool(
+                generator.targets(self)
+                & (1 << movement.board.geometry.square_of(movement.to_position))
+            )
+
         is_legal = False
         try:
             movement.validate(False)
@@ -52,7 +182,7 @@ class Piece:
 
         return is_legal
 
-    def legal_movements(self):
+    def legal_movements(self) -> list[Movement]:
         """Get the list of the piece's legals movements
         This method checks for:
             - All possible movements
@@ -62,15 +192,52 @@ class Piece:
         Returns:
             list[Movement]
         """
-        moves: list[Movement] = []
+        return list(self.iter_legal_movements())
+
+    def iter_legal_movements(self) -> Iterator[BoardMovement]:
+        """Iterates over the piece's legal movements (see `legal_movements`).
+        Each movement is only verified when reached, so stopping early saves the remaining verifications.
+        """
+        generator = self.board.legal_moves(self.player.direction)
+        if generator is not None:
+            for square in self.board.geometry.squares(generator.targets(self)):
+                yield BoardMovement(
+                    (self.position, self.board.position_of(square)), self.board
+                )
+            return
+
         for pos in self.contesting_positions():
             movement = BoardMovement((
                 self.position,
                 pos
             ), self.board)
             if self._is_movement_legal(movement):
-                moves.append(movement)
-        return moves
+                yield movement
+
+    def can_move_to(self, position: Position):
+        """Tests if the piece can legally move to the position
+        """
+        if self.board.legal_moves(self.player.direction) is not None:
+            return bool(
+                self.legal_mask() & (1 << self.board.geometry.square_of(position))
+            )
+
+        for movement in self.iter_legal_movements():
+            if movement.to_position == position:
+                return True
+        return False
+
+    def legal_mask(self) -> int:
+        """Get the mask of the squares the piece can legally move to
+        """
+        generator = self.board.legal_moves(self.player.direction)
+        if generator is not None:
+            return generator.targets(self)
+
+        mask = 0
+        for movement in self.legal_movements():
+            mask |= 1 << movement.to_position.square
+        return mask
 
     def move(self, movement: Movement) -> None:
         from chess.pieces.king import King
@@ -82,7 +249,7 @@ class Piece:
             eaten.eaten_by = self
             movement.with_piece_eaten = eaten
 
-        self.position.copy_from(movement.to_position)
+        self.__relocate(movement.to_position)
         return self.moved(movement)
 
     def moved(self, movement: Movement) -> None:
@@ -93,7 +260,7 @@ class Piece:
         """
 
     def cancel_move(self, movement: Movement) -> None:
-        self.position.copy_from(movement.from_position)
+        self.__relocate(movement.from_position)
 
         if movement.with_piece_eaten is not None:
             movement.with_piece_eaten.eaten_by = None
@@ -104,8 +271,21 @@ class Piece:
     def move_canceled(self, movement: Movement) -> None:
         pass
 
+    def __relocate(self, position: Position):
+        if position.geometry is not self.board.geometry:
+            position = Position.validate(self.board, *position.raw_xy)
+
+        if self.playable:
+            self.board._release(self)
+            self.position = position
+            self.board._occupy(self)
+        else:
+            self.position = position
+
     def remove_from_board(self):
         self.board._pieces.remove(self)
+        self.board._release(self)
+        self.board._pieces_removed()
 
     def __str__(self) -> str:
         char = self.REPRESENTATION[self.player.is_black]
@@ -115,21 +295,31 @@ class Piece:
 
 
 class WithMovementObserver(Piece):
-    __moved_from: 'BoardMovement | None' = None
+    __moved_from: 'BoardMovement | bool | None' = None
 
     @property
     def has_moved(self):
         return bool(self.__moved_from)
 
+    def mark_as_moved(self, moved=True):
+        """Sets if the piece has already moved, when setting up a position without playing its movements
+        """
+        # No movement is known: canceling a movement never resets it
+        self.__moved_from = True if moved else None
+        self.board._first_moves_changed()
+        return self
+
     def moved(self, movement: Movement) -> None:
         if self.__moved_from is None:
             self.__moved_from = movement.in_board(self.board)
+            self.board._first_moves_changed()
 
         return super().moved(movement)
 
     def move_canceled(self, movement: Movement) -> None:
         if movement.in_board(self.board) is self.__moved_from:
             self.__moved_from = None
+            self.board._first_moves_changed()
 
         return super().move_canceled(movement)
 
@@ -137,49 +327,43 @@ class WithMovementObserver(Piece):
 
 
 class PieceList:
-    def __init__(self, pieces: list[Piece]) -> None:
-        self.__pieces = filter(None, pieces)
+    def __init__(self, pieces: list[Piece], board: 'Board | None' = None) -> None:
+        self.__pieces: list[Piece] = pieces
+        self.__filters: list[Callable[[Piece], bool]] = []
+
+        # The board's square index (only holding playable pieces) is used
+        # to resolve `at` queries without scanning the whole list
+        self.__board = board
+        self.__only_playable = False
+        self.__square: int | None = None
+
+    def __filter(self, test: Callable[[Piece], bool]):
+        self.__filters.append(test)
+        return self
 
     def playable(self, is_playable: bool = True):
-        self.__pieces = filter(
-            lambda p: p.playable == is_playable,
-            self.__pieces
-        )
-        return self
+        self.__only_playable = self.__only_playable or is_playable
+        return self.__filter(lambda p: p.playable == is_playable)
 
     def at(self, x: str | Position, y: int | None = None, should_be: bool = True):
         pos = x if isinstance(x, Position) else Position(x, y)
 
-        self.__pieces = filter(
-            lambda p: (p.position == pos) is should_be,
-            self.__pieces
-        )
+        if should_be and self.__square is None and self.__board is not None:
+            in_board = self.__board.geometry.position(*pos.raw_xy)
+            if in_board is not None:
+                pos = in_board
+                self.__square = in_board.square
 
-        return self
+        return self.__filter(lambda p: (p.position == pos) is should_be)
 
     def of(self, player: Player, should_be: bool = True):
-        self.__pieces = filter(
-            lambda p: (p.player == player) is should_be,
-            self.__pieces
-        )
-
-        return self
+        return self.__filter(lambda p: (p.player == player) is should_be)
 
     def type(self, only: type[Piece], should_be: bool = True):
-        self.__pieces = filter(
-            lambda p: isinstance(p, only) is should_be,
-            self.__pieces
-        )
-
-        return self
+        return self.__filter(lambda p: isinstance(p, only) is should_be)
 
     def exept(self, *pieces: Piece):
-        self.__pieces = filter(
-            lambda p: p not in pieces,
-            self.__pieces
-        )
-
-        return self
+        return self.__filter(lambda p: p not in pieces)
 
     def contesting(
             self,
@@ -187,43 +371,38 @@ class PieceList:
             and_can_move_to: bool = False,
             should_be: bool = True
     ):
-        self.__pieces = filter(
+        return self.__filter(
             lambda p: (
-                position in (
-                    map(
-                        lambda m: m.to_position,
-                        p.legal_movements()
-                    )
-                    if and_can_move_to else p.contesting_positions()
-                )
-            ) == should_be,
-            self.__pieces
+                p.can_move_to(position)
+                if and_can_move_to else position in p.contesting_positions()
+            ) == should_be
         )
 
-        return self
-
     def where(self, test: Callable[[Piece], bool], should_be: bool = True):
-        self.__pieces = filter(
-            lambda p: test(p) is should_be,
-            self.__pieces
-        )
-
-        return self
+        return self.__filter(lambda p: test(p) is should_be)
 
     def get(self):
-        return list(self.__pieces)
+        return list(self)
 
     def first(self):
-        try:
-            return next(self.__pieces)
-        except StopIteration:
-            return None
+        return next(iter(self), None)
 
     def exist(self):
         return bool(self.first())
 
     def __iter__(self):
-        return iter(self.__pieces)
+        pieces: Iterable[Piece | None] = self.__pieces
+        if (
+            self.__board is not None
+            and self.__only_playable
+            and self.__square is not None
+        ):
+            pieces = (self.__board._occupancy[self.__square],)
+
+        pieces = filter(None, pieces)
+        for test in self.__filters:
+            pieces = filter(test, pieces)
+        return pieces
 
     def __bool__(self):
         return self.exist()
@@ -3,7 +3,6 @@ from math import copysign
 from typing import TYPE_CHECKING
 from chess.movement.movement import Movement
 from chess.pieces._piece import WithMovementObserver
-from chess.position import Position
 from chess.pieces.rook import Rook
 
 if TYPE_CHECKING:
@@ -23,8 +22,15 @@ class King(WithMovementObserver):
 
     NOTATION = 'k'
 
+    VALUE = 0
+
+    LEAPS = (
+        (-1, -1), (-1, 0), (-1, 1), (0, -1),
+        (0, 1), (1, -1), (1, 0), (1, 1)
+    )
+
     def __init__(self, board: 'Board', player: 'Player', x: str, y: int | None = None) -> None:
-        super().__init__(board, player, 0, x, y)
+        super().__init__(board, player, self.VALUE, x, y)
 
     def toggle_checkmate_representation(self, force: None | bool = None):
         use_check_mate = (
@@ -41,31 +47,21 @@ class King(WithMovementObserver):
 
         return self
 
-    def contesting_positions(self) -> list[Movement]:
-        contesting = []
-
-        for x in range(-1, 2):
-            for y in range(-1, 2):
-                if x == y == 0:
-                    continue
-                if position := self.position.move().addXY(x, y).safe_position():
-                    override_piece = self.board.pieces.at(position).first()
-
-                    if override_piece and override_piece.player is self.player:
-                        continue
+    def iter_legal_movements(self):
+        yield from super().iter_legal_movements()
 
-                    contesting.append(position)
-
-        return contesting
+        for castle_direction in CastlingDirection:
+            if movement := self.get_castle_movement(castle_direction):
+                yield movement
 
-    def legal_movements(self) -> list[Movement]:
-        castles = []
+    def legal_mask(self) -> int:
+        mask = super().legal_mask()
 
         for castle_direction in CastlingDirection:
             if movement := self.get_castle_movement(castle_direction):
-                castles.append(movement)
+                mask |= 1 << movement.to_position.square
 
-        return super().legal_movements() + castles
+        return mask
 
     def moved(self, movement: Movement):
         movement.with_castling = self.castle_type(movement)
@@ -85,7 +81,12 @@ class King(WithMovementObserver):
         """
         Tests if all cases in the king's movement are empty and not contested by a opponent's piece
         """
-        if self.castle_type(movement) is None:
+        castling = self.castle_type(movement)
+        if castling is None:
+            return False
+
+        rook = self.castling_rook(castling)
+        if rook is None:
             return False
 
         # Checking if cases are not contested nor occupied
@@ -93,38 +94,55 @@ class King(WithMovementObserver):
         end = movement.to_position.x_index
         direction = int(copysign(1, end - start))
 
+        geometry = self.board.geometry
+        bitboards = self.board.bitboards
+        y_index = movement.from_position.y_index
+        path = 0
         for x_index in range(start, end + 1 * direction, direction):
-            position = Position.validate(
-                self.board,
-                self.board.X_RANGE[x_index], movement.from_position.raw_y
-            )
-            if (
-                (self.position != position and self.board.pieces.at(position))
-                or self.board.pieces.of(self.player, False).contesting(position)
-            ):
-                return False
-
-        return True
+            path |= 1 << geometry.square(x_index, y_index)
 
-    def get_castle_movement(self, direction: CastlingDirection) -> Movement | None:
+        # The rook also needs the cases up to the king to be empty
+        between = 0
+        for x_index in range(min(start, rook.position.x_index) + 1, max(start, rook.position.x_index)):
+            between |= 1 << geometry.square(x_index, y_index)
+
+        if (bitboards.all & ~bitboards.bit(self) & ~bitboards.bit(rook)) & (path | between):
+            return False
+
+        return not self.board.attack_map(-self.player.direction) & path
+
+    def castling_rook(self, direction: CastlingDirection) -> Rook | None:
+        """Get the rook the king can castle with in the given direction, if both of them never moved.
+        This does not check the castling path.
+        """
         if self.has_moved:
             return
 
-        king_movement = self.position.move().addX(2, direction.value).safe_movement()
-
-        if not (king_movement and self.__is_able_to_castle(king_movement)):
+        geometry = self.board.geometry
+        rook = self.board._occupancy_at(geometry.square(
+            0 if direction == CastlingDirection.QUEEN else geometry.width - 1,
+            self.position.y_index
+        ))
+
+        if not (
+            isinstance(rook, Rook)
+            and rook.player is self.player
+            and not rook.has_moved
+        ):
             return
 
-        rook_x_index = 0 if direction == CastlingDirection.QUEEN else -1
-        rook: Rook | None = self.board.pieces.of(self.player).where(
-            lambda p: isinstance(p, Rook) and not p.has_moved
-        ).at(
-            self.board.X_RANGE[rook_x_index] + self.position.y
-        ).first()  # type: ignore
+        return rook
 
+    def get_castle_movement(self, direction: CastlingDirection) -> Movement | None:
+        rook = self.castling_rook(direction)
         if rook is None:
             return
 
+        king_movement = self.position.move().addX(2, direction.value).safe_movement()
+
+        if not (king_movement and self.__is_able_to_castle(king_movement)):
+            return
+
         rook_final_position = king_movement.to_position.move(
         ).addX(-1, direction.value).safe_position()
         if not rook_final_position:
@@ -14,6 +14,7 @@ if TYPE_CHECKING:
 class Pawn(WithMovementObserver):
     REPRESENTATION = ("♙", "♟")
     NOTATION = 'p'
+    VALUE = 1
 
     PROMOTABLE_AS: list[tuple[str, Any]] = [
         ('reine', Queen),
@@ -23,7 +24,7 @@ class Pawn(WithMovementObserver):
     ]
 
     def __init__(self, board: 'Board', player: Player, x: str, y: int | None = None) -> None:
-        super().__init__(board, player, 1, x, y)
+        super().__init__(board, player, self.VALUE, x, y)
         self.__force_promotion_to: Any | None = None
 
     def force_promotion_as(self, choice: type[Piece] | Literal['ask']):
@@ -35,6 +36,12 @@ class Pawn(WithMovementObserver):
 
         return self
 
+    @property
+    def forced_promotion(self) -> type[Piece] | None:
+        """The piece the pawn will be promoted as, or None if the player is asked
+        """
+        return self.__force_promotion_to
+
     def require_promotion(self, movement: Movement):
         return (
             self.playable
@@ -74,8 +81,9 @@ class Pawn(WithMovementObserver):
         super().moved(movement)
 
         if self.require_promotion(movement):
-            movement.with_promotion = (self, self.__promote())
+            # The pawn leaves the square before the promoted piece takes it
             self.ghost = True
+            movement.with_promotion = (self, self.__promote())
 
     def move_canceled(self, movement: Movement) -> None:
         if movement.with_promotion:
@@ -86,24 +94,38 @@ class Pawn(WithMovementObserver):
 
         return super().move_canceled(movement)
 
+    @classmethod
+    def has_pattern(cls):
+        return True
+
+    @classmethod
+    def attacks_mask(cls, geometry, pieces, empty, direction):
+        return geometry.shift(pieces, -1, direction) | geometry.shift(pieces, 1, direction)
+
+    @classmethod
+    def attackers_mask(cls, geometry, square, occupied, direction):
+        bit = 1 << square
+        return geometry.shift(bit, -1, -direction) | geometry.shift(bit, 1, -direction)
+
+    def contesting_mask(self) -> int:
+        bitboards = self.board.bitboards
+        geometry = bitboards.geometry
+        empty = bitboards.empty
+        bit = bitboards.bit(self)
+
+        forward = geometry.shift(bit, 0, self.player.direction) & empty
+        contesting = forward
+
+        # Checking `forward` verifies there is no piece in front of this one
+        if not self.has_moved and forward:
+            contesting |= geometry.shift(
+                forward, 0, self.player.direction
+            ) & empty
+
+        return contesting | (
+            self.attacks_mask(geometry, bit, empty, self.player.direction)
+            & bitboards.of(-self.player.direction)
+        )
+
     def contesting_positions(self) -> list[Movement]:
-        contesting = []
-        forward = self.position.move().addY(1, self.player.direction).safe_position()
-        if forward and not self.board.pieces.at(forward).exist():
-            contesting.append(forward)
-
-        # The "and contesting" is to verify there is no piece in front of this one
-        if not self.has_moved and contesting:
-            forward2 = self.position.move().addY(2, self.player.direction).safe_position()
-            if forward2 and not self.board.pieces.at(forward2).exist():
-                contesting.append(forward2)
-
-        for x in -1, 1:
-            position = self.position.move().addXY(
-                x, 1, self.player.direction).safe_position()
-            if position is None:
-                continue
-            if self.board.pieces.at(position).of(self.player, False).exist():
-                contesting.append(position)
-
-        return contesting
+        return self.board.positions_of(self.contesting_mask())
@@ -1,5 +1,4 @@
 from typing import TYPE_CHECKING
-from chess.movement.movement import Movement
 from chess.pieces._piece import WithMovementObserver
 from chess.players._player import Player
 
@@ -10,31 +9,9 @@ if TYPE_CHECKING:
 class Rook(WithMovementObserver):
     REPRESENTATION = ("♖", "♜")
     NOTATION = 'r'
+    VALUE = 5
 
-    def __init__(self, board: 'Board', player: Player, x: str, y: int | None = None) -> None:
-        super().__init__(board, player, 5, x, y)
-
-    def contesting_positions(self) -> list[Movement]:
-        contesting = []
-
-        for dx in range(-1, 2):
-            for dy in range(-1, 2):
-                if dx and dy:
-                    continue
+    RAYS = ((-1, 0), (1, 0), (0, -1), (0, 1))
 
-                distance = 1
-                while 1:
-                    position = self.position.move().addXY(dx, dy, distance).safe_position()
-                    if not position:
-                        break
-
-                    override_piece = self.board.pieces.at(
-                        position
-                    ).first()
-                    if override_piece:
-                        if override_piece.player is not self.player:
-                            contesting.append(position)
-                        break
-                    contesting.append(position)
-                    distance += 1
-        return contesting
+    def __init__(self, board: 'Board', player: Player, x: str, y: int | None = None) -> None:
+        super().__init__(board, player, self.VALUE, x, y)
@@ -65,14 +65,19 @@ class DrawReason(Enum):
     def __str__(self) -> str:
         return {
             DrawReason.STALEMATE: "Mouvement impossible",
-            DrawReason.REPETITION: "Répétition du même mouvement 3 fois",
-            DrawReason.FIFTY_MOVE: "50 mouvements sans aucune prise",
+            DrawReason.REPETITION: "Répétition de la même position 3 fois",
+            DrawReason.FIFTY_MOVE: "50 mouvements sans prise ni mouvement de pion",
+            DrawReason.SEVENTY_MOVE: "75 mouvements sans prise ni mouvement de pion",
             DrawReason.MUTUAL_AGREEMENT: "Demande accepté",
             DrawReason.INSUFFICIENT_MATERIAL: "Materiel insuffisant"
         }.get(self, self.name)
 
 
 class StatusVerifier():
+    # Halfmoves without any capture or pawn move
+    FIFTY_MOVE_HALFMOVES = 100
+    SEVENTY_MOVE_HALFMOVES = 150
+
     def __init__(self, player: Player, board: 'Board', with_check=False, with_checkmate=False, with_draw=False) -> None:
         self.__player = player
         self.__board = board
@@ -92,9 +97,9 @@ class StatusVerifier():
 
     def with_check(self, verify=True):
         self.is_checked = (
-            self.board.pieces.of(
-                self.player, False
-            ).contesting(self.__king.position).exist()
+            self.board.is_attacked(
+                self.__king.position.square, -self.player.direction
+            )
         ) if verify and self.is_checked is None else self.is_checked
 
         return self
@@ -107,26 +112,7 @@ class StatusVerifier():
         return self
 
     def __find_draw_reason(self) -> DrawReason | None:
-        from chess.pieces.bishop import Bishop
-        from chess.pieces.king import King
-        from chess.pieces.knight import Knight
-
-        min_pieces, max_pieces = sorted([
-            self.board.pieces.of(self.__player).type(King, False).get(),
-            self.board.pieces.of(self.__player, False).type(
-                King, False
-            ).get()
-        ], key=len)
-
-        if (
-            not min_pieces
-            and len(max_pieces) == 1
-            and isinstance(max_pieces[0], (Bishop, Knight))
-        ) or (
-            len(min_pieces) == len(max_pieces) == 1
-            and isinstance(min_pieces[0], Bishop)
-            and isinstance(max_pieces[0], Bishop)
-        ):
+        if self.board.material.is_insufficient():
             return DrawReason.INSUFFICIENT_MATERIAL
 
         if not (
@@ -134,36 +120,14 @@ class StatusVerifier():
         ):
             return DrawReason.STALEMATE
 
-        _cache_data_template = {
-            "last_move": {
-                "iterations": 0,
-                "move": None
-            },
-            "no_capture_iterations": 0
-        }
-        cache = {
-            "whites": _cache_data_template.copy(),
-            "blacks": _cache_data_template.copy()
-        }
-
-        for movement in self.board.moves.iter("lifo"):
-            piece = movement.validated_as
-            assert piece is not None, "Error: movement has not been validated."
-            cache_data = cache['whites'] if piece.player.is_white else cache['blacks']
-
-            if movement.with_piece_eaten:
-                cache_data['no_capture_iterations'] = 0
-            else:
-                cache_data['no_capture_iterations'] += 1
-                if cache_data['no_capture_iterations'] >= 50:
-                    return DrawReason.FIFTY_MOVE
-
-            if cache_data['last_move']['move'] == movement:
-                cache_data['last_move']['iterations'] += 1
-                if cache_data['last_move']['iterations'] >= 3:
-                    return DrawReason.REPETITION
-
-            cache_data['last_move']['move'] = movement
+        if self.board.halfmove_clock >= self.SEVENTY_MOVE_HALFMOVES:
+            return DrawReason.SEVENTY_MOVE
+
+        if self.board.halfmove_clock >= self.FIFTY_MOVE_HALFMOVES:
+            return DrawReason.FIFTY_MOVE
+
+        if self.board.repetitions >= 3:
+            return DrawReason.REPETITION
 
     def with_draw(self, verify=True):
         if verify:
@@ -180,9 +144,8 @@ class StatusVerifier():
         return self.__board
 
     def has_movable_piece(self):
-        for piece in self.board.pieces.of(self.player):
-            if piece.legal_movements():
-                return True
+        for _ in self.board.iter_legal_movements(self.player.direction):
+            return True
         return False
 
     def unvalitate(self):
@@ -0,0 +1,329 @@
+from time import perf_counter
+from typing import TYPE_CHECKING, Literal
+from chess.movement.encoding import decode_move, encode_move
+from chess.movement.generator import movement_name, movements_of
+from chess.players._player import Player
+from chess.players.transposition import TranspositionTable
+
+if TYPE_CHECKING:
+    from chess.boards.board import Board
+    from chess.game.book import OpeningBook
+    from chess.game.game import ChessGame
+    from chess.movement.board_movement import BoardMovement
+    from chess.movement.movement import Movement
+    from chess.pieces._piece import Piece
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search when its time is over"""
+
+
+class SearchReport:
+    def __init__(self, depth: int, score: int, nodes: int, duration: float, pv: list[str]) -> None:
+        self.depth = depth
+        self.score = score
+        self.nodes = nodes
+        self.duration = duration
+        # Principal variation: the best movements of both players, as "e2e4"
+        self.pv = pv
+
+    @property
+    def nps(self):
+        return self.nodes / self.duration if self.duration else 0
+
+    @property
+    def mate_in(self):
+        """Number of movements of the player before the mate (negative if the player is mated), or None
+        """
+        if abs(self.score) < Search.MATE - Search.MAX_PLY:
+            return None
+        plies = Search.MATE - abs(self.score)
+        return (plies + 1) // 2 if self.score > 0 else -(plies // 2)
+
+    def __str__(self) -> str:
+        mate_in = self.mate_in
+        score = f"mat en {mate_in}" if mate_in is not None else f"{self.score / Search.PAWN:+.2f}"
+        return (
+            f"Profondeur {self.depth} : {score}, {self.nodes} noeuds en {self.duration:.2f}s "
+            f"({self.nps:.0f} noeuds/s) - {' '.join(self.pv)}"
+        )
+
+
+class Search:
+    """Negamax alpha-beta search with iterative deepening, on the current position of a board.
+
+    Movements are made and canceled on the board (see `perft`), which is back
+    to its position once the search is done. The evaluation is the material (`Piece.VALUE`).
+    The results of the positions are kept in a transposition table, which can be shared by several searches.
+    """
+    PAWN = 100
+    MATE = 1_000_000
+    MAX_PLY = 128
+    # Number of nodes between two time checks
+    TIME_CHECK = 256
+
+    def __init__(self, board: 'Board', table: TranspositionTable | None = None) -> None:
+        self.board = board
+        self.table = table or TranspositionTable(1)
+        self.nodes = 0
+
+        self.__deadline: float | None = None
+
+    def iterate(self, max_depth: int, time_limit: float | None = None):
+        """Searches the position one more depth at a time, until `max_depth` or the time limit (in seconds).
+        Each completed depth is yielded as a report; an unfinished depth is dropped.
+        The first depth is always completed, so that there is a movement to play.
+        """
+        start = perf_counter()
+        deadline = None if time_limit is None else start + time_limit
+
+        self.nodes = 0
+        self.table.new_search()
+        for depth in range(1, max_depth + 1):
+            self.__deadline = None if depth == 1 else deadline
+            try:
+                score = self.negamax(depth, -self.MATE - 1, self.MATE + 1, 0)
+            except SearchTimeout:
+                return
+
+            yield SearchReport(depth, score, self.nodes, perf_counter() - start, self.principal_variation(depth))
+            if deadline is not None and perf_counter() > deadline or abs(score) >= self.MATE - depth:
+                return
+
+    def negamax(self, depth: int, alpha: int, beta: int, ply: int) -> int:
+        """Get the score of the position for the player whose turn it is
+        """
+        board = self.board
+        self.nodes += 1
+        if self.__deadline is not None and self.nodes % self.TIME_CHECK == 0 and perf_counter() > self.__deadline:
+            raise SearchTimeout()
+
+        if ply and (
+            board.repetitions > 1
+            or board.halfmove_clock >= 100
+            or board.material.is_insufficient()
+        ):
+            return 0
+
+        if depth <= 0:
+            return self.evaluate()
+
+        table = self.table
+        key = board.key
+        stored = table.probe(key)
+        if stored and ply and table.depth_of(stored) >= depth:
+            score = self.__from_table(table.score_of(stored), ply)
+            bound = table.bound_of(stored)
+            if bound == table.EXACT \
+                    or bound == table.LOWER and score >= beta \
+                    or bound == table.UPPER and score <= alpha:
+                return score
+
+        movements = list(movements_of(board))
+        if not movements:
+            king = board._king_of(board.turn)
+            checked = king is not None and board.is_attacked(king.position.square, -board.turn)
+            return -self.MATE + ply if checked else 0
+
+        original_alpha = alpha
+        best_code = 0
+        for (movement, promote_as) in self.__ordered(movements, table.move_of(stored)):
+            score = -self.__search_movement(movement, promote_as, depth - 1, -beta, -alpha, ply + 1)
+            if score > alpha:
+                alpha = score
+                best_code = encode_move(movement, promote_as)
+                if alpha >= beta:
+                    break
+
+        table.store(
+            key, best_code, self.__to_table(alpha, ply), depth,
+            table.UPPER if alpha <= original_alpha else table.LOWER if alpha >= beta else table.EXACT
+        )
+        return alpha
+
+    def __to_table(self, score: int, ply: int):
+        """Mate scores are stored from the position, not from the root of the search"""
+        if score > self.MATE - self.MAX_PLY:
+            return score + ply
+        if score < self.MAX_PLY - self.MATE:
+            return score - ply
+        return score
+
+    def __from_table(self, score: int, ply: int):
+        if score > self.MATE - self.MAX_PLY:
+            return score - ply
+        if score < self.MAX_PLY - self.MATE:
+            return score + ply
+        return score
+
+    def __search_movement(self, movement: 'BoardMovement', promote_as: 'type[Piece] | None', depth: int, alpha: int, beta: int, ply: int):
+        from chess.pieces.pawn import Pawn
+
+        pawn = self.board._occupancy_at(movement.from_position.square)
+        if promote_as is not None:
+            assert isinstance(pawn, Pawn)
+            forced = pawn.forced_promotion
+            pawn.force_promotion_as(promote_as)
+
+        movement.validate()
+        try:
+            return self.negamax(depth, alpha, beta, ply)
+        finally:
+            movement.unvalidate()
+            if promote_as is not None:
+                assert isinstance(pawn, Pawn)
+                pawn.force_promotion_as(forced or "ask")
+
+    def __ordered(self, movements: list[tuple['BoardMovement', 'type[Piece] | None']], best: int):
+        """Best movement found by a previous search first, then captures of the most valuable pieces, then promotions
+        """
+        board = self.board
+
+        def priority(item: tuple['BoardMovement', 'type[Piece] | None']):
+            movement, promote_as = item
+            if best and encode_move(movement, promote_as) == best:
+                return -self.MATE
+
+            eaten = board._occupancy_at(movement.to_position.square)
+            score = 0
+            if eaten is not None:
+                mover = board._occupancy_at(movement.from_position.square)
+                score -= 10 * eaten.VALUE - (mover.VALUE if mover else 0)
+            if promote_as is not None:
+                score -= promote_as.VALUE
+            return score
+
+        return sorted(movements, key=priority)
+
+    def evaluate(self) -> int:
+        """Material balance for the player whose turn it is
+        """
+        score = 0
+        for (direction, kind), mask in self.board.bitboards.pieces.items():
+            if mask:
+                score += direction * kind.VALUE * mask.bit_count()
+        return score * self.PAWN * self.board.turn
+
+    def principal_variation(self, depth: int):
+        """Get the best movements found, from the current position (as long as they are in the table)
+        """
+        from chess.pieces.pawn import Pawn
+
+        board = self.board
+        pv: list[str] = []
+        made: list['BoardMovement'] = []
+
+        while len(pv) < depth:
+            code = self.table.move_of(self.table.probe(board.key))
+            if not code:
+                break
+
+            movement, promote_as = decode_move(code, board)
+            piece = board._occupancy_at(movement.from_position.square)
+            if piece is None or piece.player.direction != board.turn or not piece.can_move_to(movement.to_position):
+                break
+
+            if promote_as is not None:
+                assert isinstance(piece, Pawn)
+                piece.force_promotion_as(promote_as)
+            played = movement.in_board(board)
+            played.validate()
+            if promote_as is not None:
+                piece.force_promotion_as("ask")  # type: ignore
+
+            made.append(played)
+            pv.append(movement_name(played, promote_as))
+
+        for played in reversed(made):
+            played.unvalidate()
+        return pv
+
+
+class BotPlayer(Player):
+    def __init__(
+            self,
+            direction: Literal[-1, 1],
+            name: str | None = None,
+            depth=3,
+            time_limit: float | None = None,
+            book: 'OpeningBook | None' = None,
+            hash_size=16,
+            verbose=True
+    ) -> None:
+        """Creates a player whose movements are searched
+
+        Args:
+            depth (int, optional): The maximum depth of the search, in half moves. Defaults to 3.
+            time_limit (float | None, optional): The time given to each search, in seconds (the depth being searched is dropped). Defaults to None.
+            book (OpeningBook | None, optional): The opening book played while the position is in it. Defaults to None.
+            hash_size (int, optional): The size of the transposition table kept between the searches, in MB. Defaults to 16.
+            verbose (bool, optional): If the reports of the search are printed. Defaults to True.
+        """
+        super().__init__(direction, name)
+        self.depth = depth
+        self.time_limit = time_limit
+        self.book = book
+        self.verbose = verbose
+        self.table = TranspositionTable(hash_size)
+
+        self.reports: list[SearchReport] = []
+
+    def get_move(self, game: 'ChessGame'):
+        board = game.board
+        assert board.turn == self.direction, "It is not the turn of the bot."
+
+        if self.book is not None:
+            book_move = self.book.choose(board)
+            if book_move is not None:
+                if self.verbose:
+                    print(f"{self} : {book_move} (livre d'ouvertures)")
+                self.__force_promotion(board, book_move.movement, book_move.promote_as)
+                return book_move.movement
+
+        self.reports = []
+        for report in Search(board, self.table).iterate(self.depth, self.time_limit):
+            self.reports.append(report)
+            if self.verbose:
+                print(f"{self} : {report}")
+
+        movements = list(movements_of(board))
+        if not movements:
+            raise LookupError("The bot has no legal movement to play.")
+
+        # The best movement can be missing from the table (replaced by a deeper result): the first one is played
+        name = self.reports[-1].pv[0] if self.reports and self.reports[-1].pv else None
+        movement, promote_as = next(
+            (
+                (movement, promote_as) for (movement, promote_as) in movements
+                if movement_name(movement, promote_as) == name
+            ),
+            movements[0]
+        )
+        self.__force_promotion(board, movement, promote_as)
+        return movement
+
+    @staticmethod
+    def __force_promotion(board: 'Board', movement: 'Movement', promote_as: 'type[Piece] | None'):
+        from chess.pieces.pawn import Pawn
+
+        if promote_as is not None:
+            pawn = board._occupancy_at(board.geometry.square_of(movement.from_position))
+            assert isinstance(pawn, Pawn), "Only pawns can be promoted."
+            pawn.force_promotion_as(promote_as)
+
+
+def run(args: list[str]):
+    """Command line entry: `--search <depth> [--time <seconds>] [--hash <MB>] [--fen <fen>] [movements...]`
+    Searches the best movement of the position, printing a report for each depth, then the transposition table use.
+    """
+    from chess.cli import option, setup_game
+
+    assert args and args[0].isdigit(), "Usage : --search <profondeur> [--time <secondes>] [--hash <Mo>] [--fen <fen>] [mouvements...]"
+    time_limit, others = option(args[1:], "--time")
+    hash_size, others = option(others, "--hash")
+
+    game, _ = setup_game(others)
+    search = Search(game.board, TranspositionTable(int(hash_size or 16)))
+    for report in search.iterate(int(args[0]), None if time_limit is None else float(time_limit)):
+        print(report)
+    print(search.table)
@@ -44,7 +44,7 @@ class PhysicalPlayer(Player):
                     return "Il n'y a pas de movement à annuler"
 
                 notation = movement.notation
-                movement.cancel()
+                game.cancel()
 
                 return f"{notation} vient d'être annulé !"
             case "pause":
@@ -0,0 +1,136 @@
+from array import array
+
+
+class TranspositionTable:
+    """Results of the searched positions, in a fixed number of slots indexed by position key.
+
+    The table is allocated once: each slot is the full key of its position and
+    64 bits of packed data (see `pack`), stored in two arrays of integers.
+    A slot is replaced by a search at the same or a higher depth, or once it was
+    stored by a previous search (see `new_search`).
+    """
+    SLOT_SIZE = 16
+
+    # Bound of the stored score
+    EXACT = 1
+    LOWER = 2
+    UPPER = 3
+
+    # Packed data: movement (16 bits), score (32 bits), depth (8 bits), bound (2 bits), age (6 bits)
+    SCORE_SHIFT = 16
+    DEPTH_SHIFT = 48
+    BOUND_SHIFT = 56
+    AGE_SHIFT = 58
+    AGES = 1 << 6
+
+    def __init__(self, size_mb=16) -> None:
+        assert size_mb > 0, "The size of the table must be positive."
+        self.size_mb = size_mb
+
+        # The number of slots is a power of two, to index them with a mask
+        slots = 1 << ((size_mb << 20) // self.SLOT_SIZE).bit_length() - 1
+        self.__mask = slots - 1
+        self.__keys = array("Q", bytes(8 * slots))
+        self.__data = array("Q", bytes(8 * slots))
+        self.__age = 0
+
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+        self.overwrites = 0
+
+    def __len__(self):
+        return len(self.__keys)
+
+    @staticmethod
+    def pack(move: int, score: int, depth: int, bound: int, age: int):
+        return (
+            move
+            | (score & 0xFFFFFFFF) << TranspositionTable.SCORE_SHIFT
+            | min(depth, 0xFF) << TranspositionTable.DEPTH_SHIFT
+            | bound << TranspositionTable.BOUND_SHIFT
+            | age << TranspositionTable.AGE_SHIFT
+        )
+
+    @staticmethod
+    def move_of(data: int):
+        """The code of the best movement (see `chess.movement.encoding`), 0 if there is none"""
+        return data & 0xFFFF
+
+    @staticmethod
+    def score_of(data: int):
+        score = data >> TranspositionTable.SCORE_SHIFT & 0xFFFFFFFF
+        return score - (1 << 32) if score >> 31 else score
+
+    @staticmethod
+    def depth_of(data: int):
+        return data >> TranspositionTable.DEPTH_SHIFT & 0xFF
+
+    @staticmethod
+    def bound_of(data: int):
+        return data >> TranspositionTable.BOUND_SHIFT & 3
+
+    @staticmethod
+    def age_of(data: int):
+        return data >> TranspositionTable.AGE_SHIFT
+
+    def new_search(self):
+        """Should be called before each search: the slots of the previous ones can then be replaced first
+        """
+        self.__age = (self.__age + 1) % self.AGES
+
+    def probe(self, key: int) -> int:
+        """Get the packed data of the position, or 0 if it is not in the table
+        """
+        self.probes += 1
+        index = key & self.__mask
+        if self.__keys[index] != key:
+            return 0
+
+        data = self.__data[index]
+        if data:
+            self.hits += 1
+        return data
+
+    def store(self, key: int, move: int, score: int, depth: int, bound: int):
+        index = key & self.__mask
+        stored_key = self.__keys[index]
+        stored = self.__data[index]
+
+        if stored and stored_key == key:
+            # The best movement is kept when the new result has none
+            move = move or self.move_of(stored)
+        elif stored:
+            if self.age_of(stored) == self.__age and self.depth_of(stored) > depth:
+                return
+            self.overwrites += 1
+
+        self.stores += 1
+        self.__keys[index] = key
+        self.__data[index] = self.pack(move, score, depth, bound, self.__age)
+
+    def clear(self):
+        for index in range(len(self.__keys)):
+            self.__keys[index] = self.__data[index] = 0
+        self.probes = self.hits = self.stores = self.overwrites = 0
+
+    @property
+    def hit_rate(self):
+        return self.hits / self.probes if self.probes else 0
+
+    def usage(self, sample=1000):
+        """Get the part of the slots used by the current search (estimated on the first slots)
+        """
+        sample = min(sample, len(self))
+        used = sum(
+            1 for index in range(sample)
+            if self.__data[index] and self.age_of(self.__data[index]) == self.__age
+        )
+        return used / sample
+
+    def __str__(self) -> str:
+        return (
+            f"Table de transposition : {self.size_mb} Mo ({len(self)} entrées), "
+            f"{self.usage():.1%} utilisée, {self.hits}/{self.probes} positions trouvées ({self.hit_rate:.1%}), "
+            f"{self.stores} enregistrements dont {self.overwrites} remplacements"
+        )
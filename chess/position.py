@@ -1,22 +1,37 @@
-from typing import TYPE_CHECKING, Self
+from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from chess.boards.board import Board
+    from chess.boards.geometry import Geometry
 
 
 class Position:
+    """The coordinates of a square.
+
+    Positions are immutable (their attributes are read-only). Validated positions are shared:
+    each board geometry owns one instance per square, with its indexes precomputed.
+    """
+    __slots__ = ('__x', '__y', '__geometry', '__square', '__x_index', '__y_index')
+
     def __init__(self, x: str, y: int | None = None) -> None:
         self.__x, self.__y = self.__get_xy(x, y)
-        self._validated_in_board: 'Board|None' = None
 
-    @property
-    def in_board(self):
-        return self._validated_in_board
+        # Only known once the position is validated in a geometry
+        self.__geometry: 'Geometry | None' = None
+        self.__square = -1
+        self.__x_index = -1
+        self.__y_index = -1
 
-    @property
-    def board(self):
-        assert self._validated_in_board is not None, "Position has not been validated in board"
-        return self._validated_in_board
+    @staticmethod
+    def _of_geometry(geometry: 'Geometry', x_index: int, y_index: int):
+        """Creates the position of a square of the geometry (see `Geometry.positions`)
+        """
+        position = Position(geometry.X_RANGE[x_index], geometry.Y_RANGE[y_index])
+        position.__geometry = geometry
+        position.__square = geometry.square(x_index, y_index)
+        position.__x_index = x_index
+        position.__y_index = y_index
+        return position
 
     @staticmethod
     def __get_xy(x: str, y: int | None = None):
@@ -30,28 +45,38 @@ class Position:
     @staticmethod
     def validate(in_board: 'Board', x: str, y: int | None = None):
         x, y = Position.__get_xy(x, y)
-        assert x in in_board.X_RANGE, "Invalid x position or value"
-        assert y in in_board.Y_RANGE, "Invalid y position or value"
+        position = in_board.geometry.position(x, y)
+        if position is None:
+            assert x in in_board.X_RANGE, "Invalid x position or value"
+            assert y in in_board.Y_RANGE, "Invalid y position or value"
 
-        position = Position(x, y)
-        position._validated_in_board = in_board
         return position
 
     @property
-    def x(self):
-        return self.__x
+    def geometry(self):
+        """The geometry the position was validated in (None if it is not)"""
+        return self.__geometry
 
     @property
-    def y(self):
-        return str(self.__y)
+    def square(self):
+        """Index of the square in its geometry (-1 if the position is not validated)"""
+        return self.__square
 
     @property
     def x_index(self):
-        return self.board.X_RANGE.index(self.__x)
+        return self.__x_index
 
     @property
     def y_index(self):
-        return self.board.Y_RANGE.index(self.__y)
+        return self.__y_index
+
+    @property
+    def x(self):
+        return self.__x
+
+    @property
+    def y(self):
+        return str(self.__y)
 
     @property
     def raw_x(self):
@@ -71,20 +96,21 @@ class Position:
         from chess.movement.movement import MovementBuilder
         return MovementBuilder(self)
 
-    def copy_from(self, position: 'Position') -> Self:
-        self.__x, self.__y = position.raw_xy
-        return self
-
     def clone(self):
-        pos = Position(*self.raw_xy)
-        pos._validated_in_board = self._validated_in_board
-        return pos
+        # Positions are immutable
+        return self
 
     def __eq__(self, value: object) -> bool:
+        if value is self:
+            return True
+
         if isinstance(value, Position):
             return value.raw_xy == self.raw_xy
 
         return False
 
+    def __hash__(self) -> int:
+        return hash(self.raw_xy)
+
     def __str__(self) -> str:
         return self.x + self.y
@@ -10,9 +10,18 @@ from chess.players.physical import PhysicalPlayer
 
 
 def units():
+    import tests.units.archive
+    import tests.units.book
+    import tests.units.cache
+    import tests.units.bot
     import tests.units.check
     import tests.units.check_mate
     import tests.units.draw
+    import tests.units.fen
+    import tests.units.perft
+    import tests.units.pgn
+    import tests.units.repetition
+    import tests.units.transposition
 
 
 def debug():
@@ -0,0 +1,57 @@
+from os import remove
+from tempfile import mkstemp
+from chess.game.archive import ArchiveWriter, GameArchive
+from chess.game.game import ChessGame
+from chess.movement.encoding import decode_move, encode_move
+from chess.movement.movement import Movement
+from chess.pieces.knight import Knight
+from chess.players.physical import PhysicalPlayer
+
+
+whites = PhysicalPlayer(1)
+blacks = PhysicalPlayer(-1)
+
+# Castling, then a promotion as a knight
+FEN = "7k/P7/8/8/8/8/8/4K2R w K - 0 1"
+game = ChessGame.from_fen(whites, blacks, FEN)
+game.start()
+castling = game.play("O-O")
+game.play("Kg8")
+promotion = game.play("a8", Knight)
+assert promotion.san == "a8=N"
+
+castling_code, promotion_code = encode_move(castling), encode_move(promotion)
+assert castling_code >> 14 == 2 and promotion_code >> 12 == 0b0100
+assert decode_move(promotion_code, game.board)[1] is Knight
+
+first = ChessGame((whites, blacks))
+first.start()
+for move in ("f3", "e5", "g4", "Qh4"):
+    first.play(move)
+
+(_, path) = mkstemp()
+with ArchiveWriter(path) as writer:
+    writer.add_game(first, {"Event": "Fool"})
+    writer.add_game(game, {"Event": "Castling", "FEN": FEN})
+
+with GameArchive(path) as archive:
+    assert len(archive) == 2
+    archived = archive[-1]
+    assert archived.tags == {"Event": "Castling", "FEN": FEN}
+    assert list(archived.codes)[0] == castling_code
+
+    replayed = archived.replay()
+    assert [movement.san for movement in replayed.board.moves.iter()] == ["O-O", "Kg8", "a8=N"]
+    assert archive[0].replay().result == archive[0].result == "0-1"
+remove(path)
+
+# A failed promotion does not keep the forced piece (the pawn cannot eat its own rook)
+game = ChessGame.from_fen(whites, blacks, "1R6/1P5K/8/3k4/8/8/8/8 w - - 0 1")
+game.start()
+pawn = game.board.pieces.at("b7").first()
+try:
+    game.play(Movement(game.board.position_of(49), game.board.position_of(57)), Knight)
+    raise RuntimeError("The pinned pawn has been promoted.")
+except AssertionError:
+    pass
+assert pawn.forced_promotion is None  # type: ignore
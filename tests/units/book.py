@@ -0,0 +1,65 @@
+from os import remove
+from random import Random
+from struct import pack
+from tempfile import mkstemp
+from chess.boards.board import Board
+from chess.boards.polyglot import PolyglotKeys
+from chess.game.book import OpeningBook
+from chess.game.game import ChessGame
+from chess.pieces.knight import Knight
+from chess.players.physical import PhysicalPlayer
+
+
+whites = PhysicalPlayer(1)
+blacks = PhysicalPlayer(-1)
+
+# Reference keys of the Polyglot format
+game = ChessGame((whites, blacks))
+game.start()
+assert PolyglotKeys.hash(game.board) == 0x463b96181691fc9c
+for move in ("e4", "d5", "e5", "f5"):
+    game.play(move)
+assert PolyglotKeys.hash(game.board) == 0x22a48b5a8e47ff78
+game.play("Ke2")
+assert PolyglotKeys.hash(game.board) == 0x652a607ca3f242c1
+
+start = ChessGame((whites, blacks)).board
+castling = Board.from_fen("r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1", whites, blacks)
+promotion = Board.from_fen("7k/P7/8/8/8/8/8/K7 w - - 0 1", whites, blacks)
+
+
+def book_move(from_position: str, to_position: str, promote_as=0):
+    files = "abcdefgh"
+    return (
+        int(from_position[1]) - 1 << 9 | files.index(from_position[0]) << 6
+        | int(to_position[1]) - 1 << 3 | files.index(to_position[0]) | promote_as << 12
+    )
+
+
+entries = sorted([
+    (PolyglotKeys.hash(start), book_move("e2", "e4"), 3),
+    (PolyglotKeys.hash(start), book_move("d2", "d4"), 1),
+    # Illegal movements are left out
+    (PolyglotKeys.hash(start), book_move("e2", "e5"), 100),
+    (PolyglotKeys.hash(castling), book_move("e1", "a1"), 1),
+    (PolyglotKeys.hash(promotion), book_move("a7", "a8", 1), 1),
+])
+
+(_, path) = mkstemp()
+with open(path, "wb") as file:
+    for (key, move, weight) in entries:
+        file.write(pack(">QHHI", key, move, weight, 0))
+
+with OpeningBook(path) as book:
+    assert len(book) == 5
+    assert sorted(str(move) for move in book.moves(start)) == ["d2d4 (1)", "e2e4 (3)"]
+    assert str(book.choose(start, Random(0))) in ("d2d4 (1)", "e2e4 (3)")
+
+    (queen_side,) = book.moves(castling)
+    assert str(queen_side.movement.to_position) == "c1" and queen_side.movement.cascade is not None
+
+    (promote,) = book.moves(promotion)
+    assert promote.promote_as is Knight
+
+    assert book.choose(Board.from_fen("8/8/8/8/8/8/8/K6k w - - 0 1", whites, blacks)) is None
+remove(path)
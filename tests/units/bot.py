@@ -0,0 +1,40 @@
+from chess.game.game import ChessGame
+from chess.pieces.queen import Queen
+from chess.players.bot import BotPlayer, Search
+
+
+whites = BotPlayer(1, depth=3, verbose=False)
+blacks = BotPlayer(-1, depth=2, verbose=False)
+
+# Scholar's mate
+game = ChessGame.from_fen(
+    whites, blacks, "r1bqkb1r/pppp1ppp/2n2n2/4p2Q/2B1P3/8/PPPP1PPP/RNB1K1NR w KQkq - 4 4"
+)
+game.start()
+fen = game.board.to_fen()
+found = whites.get_move(game)
+
+# The position is restored after the search
+assert game.board.to_fen() == fen
+report = whites.reports[-1]
+assert report.mate_in == 1 and report.pv == ["h5f7"] and report.nodes > 0
+
+movement = game.play(found)
+assert movement.san == "Qxf7#" and game.has_winner_or_draw is whites
+
+# Promotions are searched
+game = ChessGame.from_fen(whites, blacks, "7k/P7/8/8/8/8/8/K7 w - - 0 1")
+game.start()
+movement = game.play(whites.get_move(game))
+assert movement.san == "a8=Q+" and isinstance(movement.with_promotion[1], Queen)  # type: ignore
+
+(*_, last) = Search(game.board).iterate(2)
+assert last.depth == 2 and last.score < 0 and game.board.to_fen() == "Q6k/8/8/8/8/8/8/K7 b - - 0 1"
+
+# The first depth is finished whatever the time limit (checked at each node here), to always play a movement
+time_check, Search.TIME_CHECK = Search.TIME_CHECK, 1
+hurried = BotPlayer(1, depth=5, time_limit=0, verbose=False)
+game = ChessGame((hurried, blacks)).start()
+game.play(hurried.get_move(game))
+assert [report.depth for report in hurried.reports] == [1]
+Search.TIME_CHECK = time_check
@@ -0,0 +1,39 @@
+from chess.boards.cache import LRUCache
+from chess.boards.normal import NormalEmptyBoard
+from chess.pieces.king import King
+from chess.pieces.pawn import Pawn
+from chess.players.physical import PhysicalPlayer
+
+
+cache: LRUCache[str] = LRUCache(2)
+assert cache.lookup("a", lambda: "A") == "A"
+assert cache.lookup("b", lambda: "B") == "B"
+assert (cache.hits, cache.misses) == (0, 2)
+
+# "a" is used again, "b" is then the least recently used and is evicted past the capacity
+assert cache.lookup("a", lambda: "new") == "A"
+assert cache.lookup("c", lambda: "C") == "C"
+assert len(cache) == 2 and (cache.hits, cache.misses) == (1, 3)
+assert cache.lookup("b", lambda: "new") == "new"
+assert cache.lookup("a", lambda: "new") == "new"
+assert (cache.hits, cache.misses) == (1, 5)
+assert str(cache) == "2/2 (1/6 hits)"
+
+cache.capacity = 1
+assert len(cache) == 1 and cache.lookup("a", lambda: "other") == "new"
+
+# The legal movements are cached by position key: a pawn that has moved back to
+# the same square setup cannot move by two squares anymore
+whites = PhysicalPlayer(1)
+blacks = PhysicalPlayer(-1)
+board = NormalEmptyBoard()
+King(board, whites, "a1")
+King(board, blacks, "h8")
+pawn = Pawn(board, whites, "e3")
+
+unmoved = board.key
+assert {str(movement.to_position) for movement in pawn.legal_movements()} == {"e4", "e5"}
+
+pawn.mark_as_moved()
+assert board.key != unmoved
+assert {str(movement.to_position) for movement in pawn.legal_movements()} == {"e4"}
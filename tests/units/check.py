@@ -1,10 +1,10 @@
-from chess.boards.board import Board
+from chess.boards.normal import NormalEmptyBoard
 from chess.pieces.king import King
 from chess.pieces.rook import Rook
 from chess.players.physical import PhysicalPlayer
 
 
-board = Board()
+board = NormalEmptyBoard()
 whites = PhysicalPlayer(1)
 blacks = PhysicalPlayer(-1)
 
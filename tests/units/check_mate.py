@@ -19,3 +19,4 @@ game.play("Qh4")
 
 verifier = whites.verify_status(board).with_checkmate()
 assert verifier.is_check_mate
+assert str(board.moves.last()).endswith("#")
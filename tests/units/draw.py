@@ -1,4 +1,4 @@
-from chess.boards.board import Board
+from chess.boards.normal import NormalEmptyBoard
 from chess.pieces.bishop import Bishop
 from chess.pieces.king import King
 from chess.pieces.pawn import Pawn
@@ -6,7 +6,7 @@ from chess.players._player import DrawReason
 from chess.players.physical import PhysicalPlayer
 
 
-board = Board()
+board = NormalEmptyBoard()
 whites = PhysicalPlayer(1)
 blacks = PhysicalPlayer(-1)
 
@@ -23,3 +23,39 @@ Pawn(board, blacks, "a4")
 verifier = blacks.verify_status(board).with_draw()
 
 assert verifier.is_draw and verifier.is_draw == DrawReason.STALEMATE
+
+# Bishops on squares of different colors
+board = NormalEmptyBoard()
+
+King(board, whites, "a1")
+King(board, blacks, "h8")
+
+Bishop(board, whites, "c1")
+Bishop(board, blacks, "c8")
+
+verifier = whites.verify_status(board).with_draw()
+assert verifier.is_draw is None
+
+board.pieces.at("c8").first().remove_from_board()
+Bishop(board, blacks, "b8")
+
+verifier = whites.verify_status(board).with_draw()
+assert verifier.is_draw == DrawReason.INSUFFICIENT_MATERIAL
+
+# Two bishops on squares of the same color against a lone king
+board = NormalEmptyBoard()
+
+King(board, whites, "a1")
+King(board, blacks, "h8")
+
+Bishop(board, whites, "c1")
+Bishop(board, whites, "e3")
+
+verifier = whites.verify_status(board).with_draw()
+assert verifier.is_draw == DrawReason.INSUFFICIENT_MATERIAL
+
+board.pieces.at("e3").first().remove_from_board()
+Bishop(board, whites, "e4")
+
+verifier = whites.verify_status(board).with_draw()
+assert verifier.is_draw is None
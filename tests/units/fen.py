@@ -0,0 +1,40 @@
+from chess.boards.board import Board
+from chess.game.game import ChessGame
+from chess.perft import perft
+from chess.players.physical import PhysicalPlayer
+
+
+START = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+
+whites = PhysicalPlayer(1)
+blacks = PhysicalPlayer(-1)
+
+game = ChessGame((whites, blacks))
+game.start()
+assert game.board.to_fen() == START
+
+for move in ("e4", "c5", "Nf3"):
+    game.play(move)
+assert game.board.to_fen() == "rnbqkbnr/pp1ppppp/8/2p5/4P3/5N2/PPPP1PPP/RNBQKB1R b KQkq - 1 2"
+
+game.board.moves.last().cancel()
+assert game.board.to_fen() == "rnbqkbnr/pp1ppppp/8/2p5/4P3/8/PPPP1PPP/RNBQKBNR w KQkq c6 0 2"
+
+assert Board.from_fen(START).to_fen() == START
+
+# Castling rights and moved pawns are seeded from the notation
+board = Board.from_fen(
+    "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1",
+    whites, blacks
+)
+assert board.castling_rights() == 0b1100
+assert perft(board, 2).nodes == 264
+
+# The players are ordered by the player to play of the position
+black_first = "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1"
+assert ChessGame.from_fen(whites, blacks, black_first).now_playing() is blacks
+try:
+    ChessGame((whites, blacks), Board.from_fen(black_first, whites, blacks))
+    assert False, "The players do not follow the turn of the board."
+except AssertionError as err:
+    assert "first player" in str(err.args[0])
@@ -0,0 +1,34 @@
+from chess.boards.normal import NormalBoard, NormalEmptyBoard
+from chess.game.game import ChessGame
+from chess.perft import START_POSITION_RESULTS, decode_position, divide, encode_position, perft
+from chess.pieces.king import King
+from chess.pieces.knight import Knight
+from chess.pieces.rook import Rook
+from chess.players.physical import PhysicalPlayer
+
+
+whites = PhysicalPlayer(1)
+blacks = PhysicalPlayer(-1)
+
+game = ChessGame((whites, blacks), NormalBoard())
+game.setup_board()
+
+for depth in (1, 2, 3):
+    assert perft(game.board, depth) == START_POSITION_RESULTS[depth]
+
+rebuilt = decode_position(encode_position(game.board))
+assert perft(rebuilt, 2) == START_POSITION_RESULTS[2]
+
+results = divide(game.board, 2, 2)
+assert len(results) == 20 and sum(r.nodes for r in results.values()) == 400
+
+# The queen side castling needs every case up to the rook to be empty
+board = NormalEmptyBoard()
+King(board, whites, "e1")
+King(board, blacks, "e8")
+Rook(board, whites, "a1")
+
+assert perft(board, 1).castles == 1
+
+Knight(board, whites, "b1")
+assert perft(board, 1).castles == 0
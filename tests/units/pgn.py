@@ -0,0 +1,59 @@
+from io import StringIO
+from chess.game.game import ChessGame
+from chess.game.pgn import PGNGame, PGNWriter, replay, replay_stream
+from chess.movement.board_movement import BoardMovement
+from chess.players._player import Player
+
+
+PGN = """[Event "Fool"]
+[Result "0-1"]
+
+1. f3 e6 {Weak} 2. g4 (2. e4 Qh4+) 2... Qh4# $1 0-1
+
+[Event "Invalid"]
+[Result "*"]
+
+1. e4 e5 2. Ke3 *
+
+[Event "Promotion"]
+[FEN "8/P6k/8/8/8/8/8/K7 w - - 0 1"]
+[Result "1/2-1/2"]
+
+1. a8=N 1/2-1/2
+"""
+
+game = PGNGame.parse(PGN.split("\n\n[")[0])
+assert game.moves == ["f3", "e6", "g4", "Qh4#"] and game.result == "0-1"
+
+results = list(replay_stream(PGN.splitlines(True), 1))
+assert [result.outcome for result in results] == ["0-1", "*", "1/2-1/2"]
+assert results[1].error is not None and results[1].moves == 2
+
+assert replay(game).outcome == "0-1"
+
+# The results of several processes are in the order of the games
+results = list(replay_stream(((PGN + "\n") * 4).splitlines(True), 2))
+assert [result.index for result in results] == list(range(12))
+assert [result.outcome for result in results] == ["0-1", "*", "1/2-1/2"] * 4
+
+# Writing while playing: canceled movements are removed
+whites, blacks = Player(Player.WHITES_DIRECTION), Player(Player.BLACKS_DIRECTION)
+output = StringIO()
+writer = PGNWriter(output)
+chess_game = ChessGame((whites, blacks)).record_to(writer, {"Event": "Fool"})
+chess_game.start()
+for move in game.moves:
+    chess_game.play(BoardMovement.decode(
+        move, chess_game.board, chess_game.now_playing()
+    ))
+    if move == "e6":
+        chess_game.cancel()
+        chess_game.play(BoardMovement.decode(
+            "e5", chess_game.board, chess_game.now_playing()
+        ))
+assert writer.games == 1 and "1. f3 e5 2. g4 Qh4# 0-1" in output.getvalue()
+
+writer.write_game(chess_game, {"Event": "Copy"})
+written = list(replay_stream(output.getvalue().splitlines(True), 1))
+assert [result.outcome for result in written] == ["0-1", "0-1"]
+assert written[1].tags["Event"] == "Copy" and written[1].moves == 4
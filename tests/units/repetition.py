@@ -0,0 +1,29 @@
+from chess.boards.normal import NormalBoard
+from chess.game.game import ChessGame
+from chess.players._player import DrawReason
+from chess.players.physical import PhysicalPlayer
+
+
+board = NormalBoard()
+whites = PhysicalPlayer(1)
+blacks = PhysicalPlayer(-1)
+
+game = ChessGame((whites, blacks), board)
+game.setup_board()
+game.start()
+
+for move in ("Nf3", "Nf6", "Ng1", "Ng8", "Nf3", "Nf6", "Ng1"):
+    game.play(move)
+
+assert board.repetitions == 2
+assert board.halfmove_clock == 7
+
+game.play("Ng8")
+assert board.repetitions == 3
+
+verifier = whites.verify_status(board).with_draw()
+assert verifier.is_draw == DrawReason.REPETITION
+
+board.moves.last().cancel()
+assert board.repetitions == 2
+assert board.halfmove_clock == 7
@@ -0,0 +1,43 @@
+from chess.game.game import ChessGame
+from chess.players.bot import Search
+from chess.players.physical import PhysicalPlayer
+from chess.players.transposition import TranspositionTable
+
+
+table = TranspositionTable(1)
+assert len(table) == (1 << 20) // TranspositionTable.SLOT_SIZE
+
+data = TranspositionTable.pack(0x1234, -999_000, 7, TranspositionTable.LOWER, 5)
+assert TranspositionTable.move_of(data) == 0x1234
+assert TranspositionTable.score_of(data) == -999_000
+assert TranspositionTable.depth_of(data) == 7
+assert TranspositionTable.bound_of(data) == TranspositionTable.LOWER
+assert TranspositionTable.age_of(data) == 5
+
+# Two keys sharing the same slot
+key, other = 42, 42 + len(table)
+assert table.probe(key) == 0
+
+table.store(key, 0x1234, 150, 4, TranspositionTable.EXACT)
+assert TranspositionTable.score_of(table.probe(key)) == 150
+
+# A deeper result is kept during the same search, the best movement is kept when a result has none
+table.store(other, 0x0101, 10, 2, TranspositionTable.UPPER)
+assert table.probe(other) == 0 and table.probe(key)
+table.store(key, 0, 100, 5, TranspositionTable.UPPER)
+assert TranspositionTable.move_of(table.probe(key)) == 0x1234
+
+# The results of previous searches are replaced
+table.new_search()
+table.store(other, 0x0101, 10, 2, TranspositionTable.UPPER)
+assert table.probe(key) == 0 and TranspositionTable.depth_of(table.probe(other)) == 2
+assert table.overwrites == 1 and 0 < table.hit_rate < 1
+
+# Searches sharing a table find their previous positions
+game = ChessGame((PhysicalPlayer(1), PhysicalPlayer(-1)))
+game.start()
+table = TranspositionTable(1)
+(*_, first) = Search(game.board, table).iterate(3)
+hits = table.hits
+(*_, second) = Search(game.board, table).iterate(3)
+assert table.hits > hits and second.nodes < first.nodes and second.pv[0] == first.pv[0]